@@ -0,0 +1,119 @@
+"""
+AI Response Cache
+
+Disk-backed cache of Claude API responses, so an identical request
+(same model settings and prompt) doesn't call the API again.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class AIResponseCache:
+    """Stores Claude response text on disk, one JSON file per request key"""
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 max_age_days: int = 7, max_entries: int = 200):
+        """
+        Initialize the response cache
+
+        Args:
+            cache_dir: Directory for cache files.
+                       Defaults to user's AppData/AutomationHub/cache/ai
+            max_age_days: Entries not used for this many days are discarded
+            max_entries: Least recently used entries beyond this count are discarded
+        """
+        if cache_dir is None:
+            appdata = os.getenv('APPDATA', os.path.expanduser('~'))
+            cache_dir = os.path.join(appdata, 'AutomationHub', 'cache', 'ai')
+
+        self.cache_dir = Path(cache_dir)
+        self.max_age_seconds = max_age_days * 86400
+        self.max_entries = max_entries
+
+    @staticmethod
+    def make_key(model: str, max_tokens: int, prompt: str) -> str:
+        """Build the cache key for a request"""
+        payload = json.dumps(
+            {'model': model, 'max_tokens': max_tokens, 'prompt': prompt},
+            sort_keys=True
+        )
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached response
+
+        Returns:
+            Response text, or None if not cached or expired
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age_seconds:
+                path.unlink()
+                return None
+
+            response = json.loads(path.read_text(encoding='utf-8'))['response']
+            os.utime(path)  # Mark as recently used
+            return response
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, response: str):
+        """Cache a response (failures are logged, never raised)"""
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temp file first so readers never see a partial entry
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps({'response': response}), encoding='utf-8')
+            os.replace(tmp_path, path)
+
+            self._prune()
+        except OSError as e:
+            logger.debug(f"Could not cache AI response: {e}")
+
+    def _prune(self):
+        """Discard the least recently used entries beyond max_entries"""
+        entries = list(self.cache_dir.glob('*.json'))
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:len(entries) - self.max_entries]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove all cached responses"""
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+# Singleton instance
+_ai_cache: Optional[AIResponseCache] = None
+
+
+def get_ai_cache() -> AIResponseCache:
+    """Get the global AIResponseCache instance."""
+    global _ai_cache
+    if _ai_cache is None:
+        _ai_cache = AIResponseCache()
+    return _ai_cache
@@ -7,7 +7,7 @@ Uses Claude AI to generate workflow scripts based on natural language descriptio
 import os
 import json
 import re
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from pathlib import Path
 
 from core.logging_config import get_logger
@@ -121,7 +121,9 @@ class AIWorkflowGenerator:
         self,
         description: str,
         category: str = "Custom",
-        use_templates: List[str] = None
+        use_templates: List[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Generate a workflow script from natural language description
@@ -130,6 +132,8 @@ class AIWorkflowGenerator:
             description: Natural language description of what to automate
             category: Category for the workflow
             use_templates: List of template types to reference
+            on_text: Called with each chunk of the AI response as it streams in
+            use_cache: If False, ask Claude again instead of reusing a cached response
 
         Returns:
             Dictionary with:
@@ -141,7 +145,7 @@ class AIWorkflowGenerator:
         try:
             # Check if API key is available
             if self.api_key:
-                return self._generate_with_ai(description, category, use_templates)
+                return self._generate_with_ai(description, category, use_templates, on_text, use_cache)
             else:
                 # Fallback to template-based generation
                 self.logger.warning("No API key found, using template-based generation")
@@ -155,7 +159,9 @@ class AIWorkflowGenerator:
         self,
         description: str,
         category: str,
-        use_templates: List[str]
+        use_templates: List[str],
+        on_text: Optional[Callable[[str], None]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """Generate workflow using Claude AI"""
         try:
@@ -170,9 +176,6 @@ class AIWorkflowGenerator:
         # Create prompt
         prompt = self._create_generation_prompt(description, category, context)
 
-        # Call Claude API
-        client = anthropic.Anthropic(api_key=self.api_key)
-
         # Get model settings from config
         from core.config import ConfigManager
         config = ConfigManager()
@@ -181,15 +184,7 @@ class AIWorkflowGenerator:
 
         self.logger.info(f"Calling Claude API for workflow generation (model: {model})...")
 
-        message = client.messages.create(
-            model=model,
-            max_tokens=max_tokens,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-
-        response_text = message.content[0].text
+        response_text = self._create_cached_message(prompt, model, max_tokens, on_text, use_cache)
 
         # Parse the response
         result = self._parse_ai_response(response_text)
@@ -197,6 +192,87 @@ class AIWorkflowGenerator:
         self.logger.info("Workflow generated successfully with AI")
         return result
 
+    def _create_cached_message(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        on_text: Optional[Callable[[str], None]] = None,
+        use_cache: bool = True
+    ) -> str:
+        """
+        Send a prompt to Claude, reusing the cached response for an identical request
+
+        Args:
+            prompt: User prompt
+            model: Claude model to use
+            max_tokens: Maximum tokens in the response
+            on_text: If given, the response is streamed and this is called with
+                     each chunk of text as it arrives (or once with a cached response)
+            use_cache: If False, always call the API; the new response still
+                       replaces the cached one
+
+        Returns:
+            Response text
+        """
+        from core.ai_cache import get_ai_cache
+
+        cache = get_ai_cache()
+        key = cache.make_key(model, max_tokens, prompt)
+
+        if use_cache:
+            response_text = cache.get(key)
+            if response_text is not None:
+                self.logger.info("Using cached Claude response")
+                if on_text:
+                    on_text(response_text)
+                return response_text
+
+        response_text = self._create_message(prompt, model, max_tokens, on_text)
+        cache.set(key, response_text)
+        return response_text
+
+    def _create_message(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        on_text: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Send a prompt to Claude
+
+        Args:
+            prompt: User prompt
+            model: Claude model to use
+            max_tokens: Maximum tokens in the response
+            on_text: If given, the response is streamed and this is called with
+                     each chunk of text as it arrives
+
+        Returns:
+            Response text
+        """
+        import anthropic
+
+        client = anthropic.Anthropic(api_key=self.api_key)
+        request = {
+            'model': model,
+            'max_tokens': max_tokens,
+            'messages': [
+                {"role": "user", "content": prompt}
+            ]
+        }
+
+        if on_text:
+            with client.messages.stream(**request) as stream:
+                for text in stream.text_stream:
+                    on_text(text)
+                message = stream.get_final_message()
+        else:
+            message = client.messages.create(**request)
+
+        return message.content[0].text
+
     def _generate_from_template(
         self,
         description: str,
@@ -885,7 +961,9 @@ def run(**kwargs):
         self,
         template_code: str,
         customization_request: str,
-        template_metadata: Dict[str, Any]
+        template_metadata: Dict[str, Any],
+        on_text: Optional[Callable[[str], None]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Customize an existing template using AI
@@ -894,6 +972,8 @@ def run(**kwargs):
             template_code: The original template code
             customization_request: User's request for how to modify the template
             template_metadata: Template metadata (name, description, parameters)
+            on_text: Called with each chunk of the AI response as it streams in
+            use_cache: If False, ask Claude again instead of reusing a cached response
 
         Returns:
             Dictionary with customized code and metadata
@@ -909,8 +989,6 @@ def run(**kwargs):
                     'parameters': template_metadata.get('parameters', {})
                 }
 
-            import anthropic
-
             # Build customization prompt
             prompt = self._create_customization_prompt(
                 template_code,
@@ -918,9 +996,6 @@ def run(**kwargs):
                 template_metadata
             )
 
-            # Call Claude API
-            client = anthropic.Anthropic(api_key=self.api_key)
-
             # Get model settings
             from core.config import ConfigManager
             config = ConfigManager()
@@ -929,15 +1004,7 @@ def run(**kwargs):
 
             self.logger.info(f"Calling Claude API for template customization (model: {model})...")
 
-            message = client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            response_text = message.content[0].text
+            response_text = self._create_cached_message(prompt, model, max_tokens, on_text, use_cache)
 
             # Parse the response
             result = self._parse_ai_response(response_text)
@@ -1133,8 +1200,6 @@ Return ONLY the Python code, no explanations. The code should be ready to save a
                     'error': 'No API key found. Please configure your Anthropic API key in Settings.'
                 }
 
-            import anthropic
-
             # Get template mode from analysis
             template_mode = analysis.get('mode', 'fill_in')
             source_file = analysis.get('source_file', 'document.docx')
@@ -1144,9 +1209,6 @@ Return ONLY the Python code, no explanations. The code should be ready to save a
             # Build mode-specific prompt
             prompt = self._create_document_generation_prompt(analysis, user_instructions)
 
-            # Call Claude API
-            client = anthropic.Anthropic(api_key=self.api_key)
-
             # Get model settings
             from core.config import ConfigManager
             config = ConfigManager()
@@ -1156,16 +1218,7 @@ Return ONLY the Python code, no explanations. The code should be ready to save a
 
             self.logger.info(f"Calling Claude API (model: {model})...")
 
-            message = client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            # Extract response text
-            response_text = message.content[0].text
+            response_text = self._create_message(prompt, model, max_tokens)
 
             # Parse the AI response
             result = self._parse_ai_response(response_text)
@@ -1549,3 +1602,21 @@ Return ONLY the Python code with proper WORKFLOW_META."""
             errors.append("Missing run(**kwargs) function")
 
         return errors
+
+
+# Singleton instance
+_ai_workflow_generator: Optional[AIWorkflowGenerator] = None
+
+
+def get_ai_workflow_generator() -> AIWorkflowGenerator:
+    """Get the global AIWorkflowGenerator instance."""
+    global _ai_workflow_generator
+    if _ai_workflow_generator is None:
+        _ai_workflow_generator = AIWorkflowGenerator()
+    return _ai_workflow_generator
+
+
+def reset_ai_workflow_generator() -> None:
+    """Discard the global AIWorkflowGenerator so the next use re-reads the API key."""
+    global _ai_workflow_generator
+    _ai_workflow_generator = None
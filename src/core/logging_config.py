@@ -7,7 +7,7 @@ import logging
 import logging.handlers
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 
 
@@ -39,6 +39,9 @@ class LoggingManager:
         self.module_log_dir = self.log_dir / 'modules'
         self.module_log_dir.mkdir(exist_ok=True)
 
+        # Module loggers already set up by get_module_logger, by module name
+        self._module_loggers: Dict[str, logging.Logger] = {}
+
         # Configure root logger
         self._setup_root_logger()
 
@@ -120,6 +123,12 @@ class LoggingManager:
         Returns:
             Logger instance with dedicated file handler
         """
+        # Reuse a logger set up earlier: setLevel clears the logging
+        # module's level cache for every logger, so skip it when unchanged
+        logger = self._module_loggers.get(module_name)
+        if logger is not None and logger.level == self.log_level:
+            return logger
+
         logger_name = f"module.{module_name}"
         logger = logging.getLogger(logger_name)
         logger.setLevel(self.log_level)
@@ -159,6 +168,7 @@ class LoggingManager:
             console_handler.setFormatter(formatter)
             logger.addHandler(console_handler)
 
+        self._module_loggers[module_name] = logger
         return logger
 
     def set_log_level(self, level: str):
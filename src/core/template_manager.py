@@ -98,6 +98,24 @@ class TemplateManager:
         logger.info(f"Discovered {len(templates)} templates")
         return templates
 
+    def templates_signature(self) -> tuple:
+        """
+        Get a cheap signature of the template files on disk
+
+        The signature changes whenever a template file is added, removed or
+        modified, so callers can reuse a previous discover_templates() result
+        while it stays the same.
+
+        Returns:
+            Sorted tuple of (path, mtime_ns) pairs for every template file
+        """
+        if not self.templates_dir.exists():
+            return ()
+
+        return tuple(sorted(
+            (str(p), p.stat().st_mtime_ns) for p in self.templates_dir.rglob("*.py")
+        ))
+
     def load_template(self, file_path: str) -> Optional[Template]:
         """
         Load a template from file path
@@ -193,7 +211,8 @@ class TemplateManager:
         valid = len(errors) == 0
         return ValidationResult(valid=valid, errors=errors, warnings=warnings, metadata=metadata)
 
-    def save_template(self, code: str, category: str, filename: str = None) -> Optional[str]:
+    def save_template(self, code: str, category: str, filename: str = None,
+                      validation: Optional[ValidationResult] = None) -> Optional[str]:
         """
         Save a template to the templates directory
 
@@ -201,13 +220,15 @@ class TemplateManager:
             code: Template Python code
             category: Template category (custom, reports, email, files)
             filename: Optional filename (will be auto-generated from name if not provided)
+            validation: Optional result of an earlier validate_template(code) call to reuse
 
         Returns:
             Path to saved file or None if save failed
         """
         try:
-            # Validate first
-            validation = self.validate_template(code)
+            # Validate first (unless the caller already did)
+            if validation is None:
+                validation = self.validate_template(code)
             if not validation.valid:
                 logger.error(f"Cannot save invalid template: {validation.errors}")
                 return None
@@ -252,34 +273,42 @@ class TemplateManager:
             logger.error(f"Failed to save template: {e}")
             return None
 
-    def import_template(self, source_path: str, category: str = 'custom') -> Optional[str]:
+    def import_template(self, source_path: str, category: str = 'custom',
+                        source_code: Optional[str] = None,
+                        validation: Optional[ValidationResult] = None) -> Optional[str]:
         """
         Import a template from an external file
 
         Args:
             source_path: Path to source template file
             category: Category to import into (default: custom)
+            source_code: Optional already-read contents of source_path
+            validation: Optional result of validate_template(source_code) to reuse
 
         Returns:
             Path to imported template or None if import failed
         """
         try:
             source = Path(source_path)
-            if not source.exists():
-                logger.error(f"Source file not found: {source_path}")
-                return None
 
-            # Read and validate template
-            with open(source, 'r', encoding='utf-8') as f:
-                code = f.read()
+            # Read and validate template, skipping steps the caller already did
+            if source_code is None:
+                if not source.exists():
+                    logger.error(f"Source file not found: {source_path}")
+                    return None
+                code = source.read_text(encoding='utf-8')
+                validation = None
+            else:
+                code = source_code
 
-            validation = self.validate_template(code)
+            if validation is None:
+                validation = self.validate_template(code)
             if not validation.valid:
                 logger.error(f"Invalid template: {validation.errors}")
                 return None
 
             # Save to templates directory
-            return self.save_template(code, category, source.name)
+            return self.save_template(code, category, source.name, validation=validation)
 
         except Exception as e:
             logger.error(f"Failed to import template: {e}")
@@ -402,3 +431,15 @@ class TemplateManager:
         for template in templates:
             categories.add(template.category)
         return sorted(list(categories))
+
+
+# Singleton instance
+_template_manager: Optional[TemplateManager] = None
+
+
+def get_template_manager() -> TemplateManager:
+    """Get the global TemplateManager instance."""
+    global _template_manager
+    if _template_manager is None:
+        _template_manager = TemplateManager()
+    return _template_manager
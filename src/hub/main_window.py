@@ -617,11 +617,12 @@ class MainWindow(QMainWindow):
         self.logger.info(f"Template imported: {file_path}")
 
         # Refresh scripts to include the new template
-        self._on_refresh_scripts()
+        self.scripts_list.clear()
+        self._populate_scripts_list()
 
-        # Refresh template browser to show the new template
+        # Insert the new template into the browser without a full rescan
         if hasattr(self, 'template_browser'):
-            self.template_browser.refresh()
+            self.template_browser.add_template(file_path)
 
         # Show success message
         self.status_bar.showMessage(f"Template imported: {Path(file_path).name}", 5000)
@@ -631,9 +632,10 @@ class MainWindow(QMainWindow):
         self.logger.info(f"Template created from document: {file_path}")
 
         # Refresh scripts to include the new template
-        self._on_refresh_scripts()
+        self.scripts_list.clear()
+        self._populate_scripts_list()
 
-        # Refresh template browser to show the new template
+        # Document templates can be saved outside the template library, so rescan
         if hasattr(self, 'template_browser'):
             self.template_browser.refresh()
 
@@ -431,6 +431,10 @@ class SettingsDialog(QDialog):
                 except Exception:
                     pass
 
+            # The shared AI generator caches the API key; make it pick up the change
+            from core.ai_workflow_generator import reset_ai_workflow_generator
+            reset_ai_workflow_generator()
+
             # Save selected model
             selected_model_data = self.model_combo.currentData()
             if selected_model_data:
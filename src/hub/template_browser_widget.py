@@ -4,17 +4,18 @@ Template Browser Widget
 UI for browsing, searching, and selecting workflow templates.
 """
 
+import bisect
 import logging
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QTextEdit, QTreeWidget, QTreeWidgetItem,
-    QLineEdit, QSplitter, QGroupBox, QMessageBox, QFileDialog
+    QLineEdit, QSplitter, QGroupBox, QMessageBox, QFileDialog, QCompleter
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QStringListModel
 from PyQt5.QtGui import QFont
 
-from core.template_manager import TemplateManager, Template
+from core.template_manager import Template, get_template_manager
 
 
 class TemplateBrowserWidget(QWidget):
@@ -23,18 +24,40 @@ class TemplateBrowserWidget(QWidget):
     template_selected = pyqtSignal(Template)  # Emits selected template for use
     template_exported = pyqtSignal(str)  # Emits path to exported template
 
+    # Shared fonts (created lazily once a QApplication exists)
+    _BOLD_FONT = None
+    _MONO_FONT = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
-        self.template_manager = TemplateManager()
+        self.template_manager = get_template_manager()
         self.templates = []
         self.selected_template = None
+        self._by_category = []  # Sorted (category, templates sorted by name) pairs
+        self._pending_preview = None  # Template whose preview is deferred until visible
+        self._btn_state = (False, False, False)  # (use, export, delete) enabled flags
+
+        # Last discovery result, reused while the template files are unchanged
+        self._discover_signature = None
+        self._discover_result = None
 
         self._create_ui()
         self._load_templates()
 
+    @classmethod
+    def _init_fonts(cls):
+        """Create the shared bold and monospace fonts on first use"""
+        if cls._BOLD_FONT is None:
+            bold_font = QFont()
+            bold_font.setBold(True)
+            cls._BOLD_FONT = bold_font
+        if cls._MONO_FONT is None:
+            cls._MONO_FONT = QFont("Courier New", 9)
+
     def _create_ui(self):
         """Create the browser UI"""
+        self._init_fonts()
         layout = QVBoxLayout(self)
 
         # Instructions
@@ -50,8 +73,17 @@ class TemplateBrowserWidget(QWidget):
         search_layout.addWidget(QLabel("Search:"))
 
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Type to filter templates...")
-        self.search_input.textChanged.connect(self._filter_templates)
+        self.search_input.setPlaceholderText("Type to search, press Enter to filter templates...")
+        self.search_input.textChanged.connect(self._on_search_text_changed)
+        self.search_input.returnPressed.connect(self._apply_search_filter)
+
+        # Autocomplete template names (matching runs in Qt, not per keystroke in Python)
+        self._completer_model = QStringListModel(self)
+        completer = QCompleter(self._completer_model, self)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        completer.activated.connect(self._apply_search_filter)
+        self.search_input.setCompleter(completer)
         search_layout.addWidget(self.search_input)
 
         self.refresh_btn = QPushButton("Refresh")
@@ -69,9 +101,7 @@ class TemplateBrowserWidget(QWidget):
         tree_layout.setContentsMargins(0, 0, 0, 0)
 
         tree_label = QLabel("Template Library")
-        tree_label_font = QFont()
-        tree_label_font.setBold(True)
-        tree_label.setFont(tree_label_font)
+        tree_label.setFont(self._BOLD_FONT)
         tree_layout.addWidget(tree_label)
 
         self.template_tree = QTreeWidget()
@@ -88,15 +118,15 @@ class TemplateBrowserWidget(QWidget):
         preview_layout.setContentsMargins(0, 0, 0, 0)
 
         preview_label = QLabel("Template Preview")
-        preview_label_font = QFont()
-        preview_label_font.setBold(True)
-        preview_label.setFont(preview_label_font)
+        preview_label.setFont(self._BOLD_FONT)
         preview_layout.addWidget(preview_label)
 
         self.preview_display = QTextEdit()
         self.preview_display.setReadOnly(True)
-        self.preview_display.setFont(QFont("Courier New", 9))
-        self.preview_display.setText("Select a template to view details.")
+        self.preview_display.setAcceptRichText(False)
+        self.preview_display.setUndoRedoEnabled(False)
+        self.preview_display.setFont(self._MONO_FONT)
+        self.preview_display.setPlainText("Select a template to view details.")
         preview_layout.addWidget(self.preview_display)
 
         # Action buttons
@@ -128,6 +158,7 @@ class TemplateBrowserWidget(QWidget):
 
         # Set initial sizes
         splitter.setSizes([300, 500])
+        splitter.splitterMoved.connect(self._flush_pending_preview)
 
         layout.addWidget(splitter)
 
@@ -140,8 +171,9 @@ class TemplateBrowserWidget(QWidget):
         """Load all templates"""
         try:
             self.status_label.setText("Loading templates...")
-            self.templates = self.template_manager.discover_templates()
+            self.templates = self._discover_templates()
             self._populate_tree()
+            self._update_completer()
             self.status_label.setText(f"Loaded {len(self.templates)} templates")
             self.logger.info(f"Loaded {len(self.templates)} templates")
         except Exception as e:
@@ -153,51 +185,164 @@ class TemplateBrowserWidget(QWidget):
                 f"Failed to load templates:\n\n{str(e)}"
             )
 
+    def _discover_templates(self):
+        """Discover templates, reusing the previous result if no template file changed"""
+        signature = self.template_manager.templates_signature()
+
+        if signature != self._discover_signature or self._discover_result is None:
+            self._discover_result = self.template_manager.discover_templates()
+            self._discover_signature = signature
+        else:
+            self.logger.debug("Template files unchanged, reusing discovered templates")
+
+        return list(self._discover_result)
+
     def _populate_tree(self):
         """Populate the template tree"""
+        self.template_tree.setUpdatesEnabled(False)
         self.template_tree.clear()
 
-        # Group templates by category
+        # Group templates by category, keeping categories and names sorted
         templates_by_category = {}
         for template in self.templates:
-            category = template.category
-            if category not in templates_by_category:
-                templates_by_category[category] = []
-            templates_by_category[category].append(template)
+            templates_by_category.setdefault(template.category, []).append(template)
 
-        # Create tree items
-        for category in sorted(templates_by_category.keys()):
-            category_templates = templates_by_category[category]
+        self._by_category = [
+            (category, sorted(templates_by_category[category], key=lambda t: t.name))
+            for category in sorted(templates_by_category)
+        ]
 
-            # Create category item
-            category_item = QTreeWidgetItem()
-            category_item.setText(0, f"{category} ({len(category_templates)})")
-            category_item.setData(0, Qt.UserRole, None)  # Mark as category
-
-            # Make category bold
-            font = category_item.font(0)
-            font.setBold(True)
-            category_item.setFont(0, font)
+        # Create tree items
+        for category, category_templates in self._by_category:
+            category_item = self._create_category_item(category, len(category_templates))
 
             # Add templates under category
-            for template in sorted(category_templates, key=lambda t: t.name):
-                template_item = QTreeWidgetItem(category_item)
-                template_item.setText(0, template.name)
-                template_item.setData(0, Qt.UserRole, template)  # Store template object
-                template_item.setToolTip(0, template.description)
-
-                # Mark user templates with icon or style
-                if not template.is_system:
-                    template_item.setText(0, f"📁 {template.name}")
+            for template in category_templates:
+                category_item.addChild(self._create_template_item(template))
 
             self.template_tree.addTopLevelItem(category_item)
 
         # Expand all categories
         self.template_tree.expandAll()
 
+        # Repaint once after all items are in place
+        self.template_tree.setUpdatesEnabled(True)
+        self.template_tree.viewport().update()
+
+    def _create_category_item(self, category: str, count: int) -> QTreeWidgetItem:
+        """Create a bold tree item for a category"""
+        category_item = QTreeWidgetItem()
+        category_item.setText(0, f"{category} ({count})")
+        category_item.setData(0, Qt.UserRole, None)  # Mark as category
+        category_item.setFont(0, self._BOLD_FONT)
+        return category_item
+
+    def _create_template_item(self, template: Template) -> QTreeWidgetItem:
+        """Create a tree item for a template"""
+        template_item = QTreeWidgetItem()
+        template_item.setData(0, Qt.UserRole, template)  # Store template object
+        template_item.setToolTip(0, template.description)
+
+        # Mark user templates with icon or style
+        if template.is_system:
+            template_item.setText(0, template.name)
+        else:
+            template_item.setText(0, f"📁 {template.name}")
+
+        return template_item
+
+    def add_template(self, file_path: str):
+        """
+        Insert a newly added template without rescanning the library
+
+        Args:
+            file_path: Path to the new template file
+        """
+        # Files outside the library or already listed need a full rescan
+        path = Path(file_path).resolve()
+        if (not path.is_relative_to(Path(self.template_manager.templates_dir).resolve())
+                or any(Path(t.file_path).resolve() == path for t in self.templates)):
+            self._load_templates()
+            return
+
+        template = self.template_manager.load_template(file_path)
+        if template is None:
+            self._load_templates()
+            return
+
+        custom_dir = str(self.template_manager.custom_dir)
+        template.is_system = not template.file_path.startswith(custom_dir)
+        self.templates.append(template)
+
+        categories = [category for category, _ in self._by_category]
+        cat_index = bisect.bisect_left(categories, template.category)
+
+        if cat_index < len(categories) and categories[cat_index] == template.category:
+            category_templates = self._by_category[cat_index][1]
+            category_item = self.template_tree.topLevelItem(cat_index)
+        else:
+            category_templates = []
+            self._by_category.insert(cat_index, (template.category, category_templates))
+            category_item = self._create_category_item(template.category, 0)
+            self.template_tree.insertTopLevelItem(cat_index, category_item)
+            category_item.setExpanded(True)
+
+        index = bisect.bisect_right(category_templates, template.name, key=lambda t: t.name)
+        category_templates.insert(index, template)
+        category_item.insertChild(index, self._create_template_item(template))
+        category_item.setText(0, f"{template.category} ({len(category_templates)})")
+
+        # Keep the new row consistent with any active search
+        if self.search_input.text():
+            self._filter_templates(self.search_input.text())
+
+        self._update_completer()
+        self.status_label.setText(f"Loaded {len(self.templates)} templates")
+
+    def _remove_template(self, template: Template):
+        """Remove a single template from the loaded list and the tree"""
+        self.templates = [t for t in self.templates if t.id != template.id]
+
+        categories = [category for category, _ in self._by_category]
+        cat_index = bisect.bisect_left(categories, template.category)
+        if cat_index == len(categories) or categories[cat_index] != template.category:
+            return
+
+        category_templates = self._by_category[cat_index][1]
+        index = next((i for i, t in enumerate(category_templates) if t.id == template.id), None)
+        if index is None:
+            return
+
+        del category_templates[index]
+        category_item = self.template_tree.topLevelItem(cat_index)
+        category_item.removeChild(category_item.child(index))
+
+        if category_templates:
+            category_item.setText(0, f"{template.category} ({len(category_templates)})")
+        else:
+            del self._by_category[cat_index]
+            self.template_tree.takeTopLevelItem(cat_index)
+
+        self._update_completer()
+        self.status_label.setText(f"Loaded {len(self.templates)} templates")
+
+    def _update_completer(self):
+        """Rebuild the search autocomplete list from the loaded templates"""
+        self._completer_model.setStringList(sorted({t.name for t in self.templates}))
+
+    def _on_search_text_changed(self, search_text: str):
+        """Show all templates again once the search box is cleared"""
+        if not search_text:
+            self._filter_templates("")
+
+    def _apply_search_filter(self, *args):
+        """Filter the tree by the current search text (Enter or completion chosen)"""
+        self._filter_templates(self.search_input.text())
+
     def _filter_templates(self, search_text: str):
         """Filter templates based on search text"""
         search_text = search_text.lower()
+        self.template_tree.setUpdatesEnabled(False)
 
         for i in range(self.template_tree.topLevelItemCount()):
             category_item = self.template_tree.topLevelItem(i)
@@ -223,6 +368,9 @@ class TemplateBrowserWidget(QWidget):
             # Hide category if no children match
             category_item.setHidden(not category_visible and bool(search_text))
 
+        self.template_tree.setUpdatesEnabled(True)
+        self.template_tree.viewport().update()
+
     def _on_template_clicked(self, item: QTreeWidgetItem):
         """Handle template selection"""
         template = item.data(0, Qt.UserRole)
@@ -230,22 +378,52 @@ class TemplateBrowserWidget(QWidget):
         if template is None:
             # Category was clicked
             self.selected_template = None
-            self.use_btn.setEnabled(False)
-            self.export_btn.setEnabled(False)
-            self.delete_btn.setEnabled(False)
-            self.preview_display.setText("Select a template to view details.")
+            self._pending_preview = None
+            self._set_button_state(False, False, False)
+            self.preview_display.setPlainText("Select a template to view details.")
             return
 
         self.selected_template = template
-        self._update_preview(template)
+
+        # Only build the preview if the panel can actually be seen
+        if self._preview_visible():
+            self._pending_preview = None
+            self._update_preview(template)
+        else:
+            self._pending_preview = template
 
         # Enable buttons
-        self.use_btn.setEnabled(True)
-        self.export_btn.setEnabled(True)
-        self.delete_btn.setEnabled(not template.is_system)
+        self._set_button_state(True, True, not template.is_system)
 
         self.status_label.setText(f"Selected: {template.name}")
 
+    def _preview_visible(self) -> bool:
+        """Check whether the preview panel is shown and not collapsed"""
+        return self.preview_display.isVisible() and self.preview_display.width() > 10
+
+    def _flush_pending_preview(self, *args):
+        """Render a deferred preview once the preview panel becomes visible"""
+        if self._pending_preview is not None and self._preview_visible():
+            template = self._pending_preview
+            self._pending_preview = None
+            self._update_preview(template)
+
+    def showEvent(self, event):
+        """Render any deferred preview when the widget is shown"""
+        super().showEvent(event)
+        self._flush_pending_preview()
+
+    def _set_button_state(self, use: bool, export: bool, delete: bool):
+        """Enable/disable the action buttons, skipping the update if nothing changed"""
+        state = (use, export, delete)
+        if state == self._btn_state:
+            return
+
+        self.use_btn.setEnabled(use)
+        self.export_btn.setEnabled(export)
+        self.delete_btn.setEnabled(delete)
+        self._btn_state = state
+
     def _on_template_double_clicked(self, item: QTreeWidgetItem):
         """Handle double-click on template (same as Use Template)"""
         template = item.data(0, Qt.UserRole)
@@ -325,7 +503,7 @@ class TemplateBrowserWidget(QWidget):
         if not template.is_system:
             preview_lines.append("• Click 'Delete' to remove this custom template")
 
-        self.preview_display.setText("\n".join(preview_lines))
+        self.preview_display.setPlainText("\n".join(preview_lines))
 
     def _use_template(self):
         """Emit signal to use the selected template"""
@@ -422,15 +600,14 @@ class TemplateBrowserWidget(QWidget):
                     )
                     self.logger.info(f"Template deleted: {self.selected_template.name}")
 
-                    # Reload templates
-                    self._load_templates()
+                    # Drop the deleted template in place rather than rescanning the library
+                    self._remove_template(self.selected_template)
 
                     # Clear preview
                     self.selected_template = None
-                    self.preview_display.setText("Select a template to view details.")
-                    self.use_btn.setEnabled(False)
-                    self.export_btn.setEnabled(False)
-                    self.delete_btn.setEnabled(False)
+                    self._pending_preview = None
+                    self.preview_display.setPlainText("Select a template to view details.")
+                    self._set_button_state(False, False, False)
                 else:
                     QMessageBox.critical(
                         self,
@@ -4,17 +4,77 @@ Template Uploader Widget
 UI for uploading and importing workflow templates.
 """
 
+import io
 import logging
+import os
+from collections import ChainMap
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Tuple
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QTextEdit, QComboBox, QFileDialog,
     QMessageBox, QGroupBox, QFormLayout
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer
 from PyQt5.QtGui import QFont, QDragEnterEvent, QDropEvent
 
-from core.template_manager import TemplateManager, ValidationResult
+if TYPE_CHECKING:
+    from core.template_manager import TemplateManager, ValidationResult
+
+_SEP = "=" * 50  # Separator line in the validation results display
+_ALLOWED_SUFFIXES = frozenset({'.py'})  # Template file extensions accepted for upload
+
+# Template information block of the validation results display
+_META_TEMPLATE = (
+    "\nTemplate Information:\n"
+    "  Name: {name}\n"
+    "  Description: {description}\n"
+    "  Category: {category}\n"
+    "  Version: {version}\n"
+)
+_META_DEFAULTS = {'name': 'N/A', 'description': 'N/A', 'category': 'N/A', 'version': '1.0.0'}
+
+
+@lru_cache(maxsize=64)
+def _validate_file(template_manager: 'TemplateManager', file_path: str,
+                   mtime_ns: int, size: int) -> Tuple[str, 'ValidationResult']:
+    """
+    Read and validate a template file, cached by its stat signature
+
+    mtime_ns and size are only part of the cache key, so an edited file
+    is re-read and re-validated while an unchanged one is served from cache.
+
+    Returns:
+        Tuple of (file contents, ValidationResult)
+    """
+    code = Path(file_path).read_text(encoding='utf-8')
+    return code, template_manager.validate_template(code)
+
+
+class TemplateValidationThread(QThread):
+    """Thread for reading and validating a template file"""
+
+    finished = pyqtSignal(str, str, object, str)  # file_path, code, ValidationResult or None, error message
+
+    def __init__(self, template_manager: 'TemplateManager', file_path: str,
+                 mtime_ns: int, size: int):
+        super().__init__()
+        self.template_manager = template_manager
+        self.file_path = file_path
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+    def run(self):
+        """Validate the template file"""
+        try:
+            code, result = _validate_file(
+                self.template_manager, self.file_path, self.mtime_ns, self.size
+            )
+            self.finished.emit(self.file_path, code, result, "")
+        except Exception as e:
+            self.finished.emit(self.file_path, "", None, str(e))
 
 
 class TemplateUploaderWidget(QWidget):
@@ -22,17 +82,60 @@ class TemplateUploaderWidget(QWidget):
 
     template_imported = pyqtSignal(str)  # Emits path to imported template
 
+    # Stylesheets, built once per process rather than on every state change
+    _DROP_IDLE_QSS = """
+        QLabel {
+            border: 2px dashed #999;
+            border-radius: 5px;
+            padding: 40px;
+            background-color: #f5f5f5;
+            min-height: 100px;
+        }
+    """
+    _DROP_SELECTED_QSS = """
+        QLabel {
+            border: 2px solid #4CAF50;
+            border-radius: 5px;
+            padding: 40px;
+            background-color: #f0f8f0;
+            min-height: 100px;
+        }
+    """
+    _DIM_QSS = "color: #666; font-style: italic;"
+    _FILE_SELECTED_QSS = "color: #000; font-style: normal;"
+    _STATUS_OK_QSS = "color: green; font-weight: bold;"
+    _STATUS_FAIL_QSS = "color: red; font-weight: bold;"
+    _STATUS_ERROR_QSS = "color: red;"
+    _TOAST_QSS = {
+        'success': "background-color: #e8f5e9; color: #2e7d32; border-radius: 4px; padding: 6px;",
+        'warning': "background-color: #fff8e1; color: #8d6e00; border-radius: 4px; padding: 6px;",
+        'error': "background-color: #ffebee; color: #c62828; border-radius: 4px; padding: 6px;",
+    }
+
+    # Shared font (created lazily once a QApplication exists)
+    _MONO_FONT = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
-        self.template_manager = TemplateManager()
+        self.template_manager = None  # Created on first validate/import
         self.selected_file = None
         self.validation_result = None
+        self._validation_thread = None
+        self._browse_dir = None  # Start directory for the file dialog
+        self._validated_code = None  # Contents of the file behind validation_result
+        self._requested_key = None  # _validate_file key of the validation in progress
+        self._validated_key = None  # _validate_file key behind validation_result
+        self._revalidate = False  # Selection changed while a validation was running
 
         self._create_ui()
 
     def _create_ui(self):
         """Create the uploader UI"""
+        cls = type(self)
+        if cls._MONO_FONT is None:
+            cls._MONO_FONT = QFont("Courier New", 9)
+
         layout = QVBoxLayout(self)
 
         # Instructions
@@ -50,15 +153,7 @@ class TemplateUploaderWidget(QWidget):
         # Drag-drop area
         self.drop_area = QLabel("Drag and drop template file here\n\nOR")
         self.drop_area.setAlignment(Qt.AlignCenter)
-        self.drop_area.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #999;
-                border-radius: 5px;
-                padding: 40px;
-                background-color: #f5f5f5;
-                min-height: 100px;
-            }
-        """)
+        self.drop_area.setStyleSheet(self._DROP_IDLE_QSS)
         self.drop_area.setAcceptDrops(True)
         self.drop_area.dragEnterEvent = self._drag_enter
         self.drop_area.dropEvent = self._drop
@@ -71,7 +166,7 @@ class TemplateUploaderWidget(QWidget):
 
         # Selected file display
         self.file_label = QLabel("No file selected")
-        self.file_label.setStyleSheet("color: #666; font-style: italic;")
+        self.file_label.setStyleSheet(self._DIM_QSS)
         file_layout.addWidget(self.file_label)
 
         file_group.setLayout(file_layout)
@@ -97,7 +192,7 @@ class TemplateUploaderWidget(QWidget):
         self.validation_display = QTextEdit()
         self.validation_display.setReadOnly(True)
         self.validation_display.setMaximumHeight(150)
-        self.validation_display.setFont(QFont("Courier New", 9))
+        self.validation_display.setFont(self._MONO_FONT)
         self.validation_display.setText("No file validated yet.")
         validation_layout.addWidget(self.validation_display)
 
@@ -127,18 +222,42 @@ class TemplateUploaderWidget(QWidget):
 
         # Status label
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #666; font-style: italic;")
+        self.status_label.setStyleSheet(self._DIM_QSS)
         layout.addWidget(self.status_label)
 
+        # Non-modal notification banner
+        self._toast = QLabel("")
+        self._toast.setWordWrap(True)
+        self._toast.hide()
+        layout.addWidget(self._toast)
+
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.timeout.connect(self._toast.hide)
+
         layout.addStretch()
 
+    def _ensure_manager(self):
+        """Create the template manager on first use"""
+        if self.template_manager is None:
+            from core.template_manager import get_template_manager
+            self.template_manager = get_template_manager()
+
     def _browse_file(self):
         """Open file browser to select template"""
+        # Start in a concrete directory so the native dialog opens quickly.
+        # Only the templates directory is remembered: until the manager is
+        # loaded, fall back to home without caching it
+        if self._browse_dir is None and self.template_manager is not None:
+            self._browse_dir = str(self.template_manager.templates_dir)
+        start_dir = self._browse_dir or os.path.expanduser("~")
+
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Template File",
-            "",
-            "Python Files (*.py);;All Files (*)"
+            start_dir,
+            "Python Files (*.py);;All Files (*)",
+            options=QFileDialog.Options()
         )
 
         if file_path:
@@ -146,137 +265,168 @@ class TemplateUploaderWidget(QWidget):
 
     def _drag_enter(self, event: QDragEnterEvent):
         """Handle drag enter event"""
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            if len(urls) == 1 and urls[0].toLocalFile().endswith('.py'):
-                event.acceptProposedAction()
+        mime_data = event.mimeData()
+        if not mime_data.hasUrls():
+            return
+
+        urls = mime_data.urls()
+        if len(urls) != 1:
+            return
+
+        if os.path.splitext(urls[0].toLocalFile())[1] in _ALLOWED_SUFFIXES:
+            event.acceptProposedAction()
 
     def _drop(self, event: QDropEvent):
         """Handle drop event"""
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            if len(urls) == 1:
-                file_path = urls[0].toLocalFile()
-                if file_path.endswith('.py'):
-                    self._set_selected_file(file_path)
-                    event.acceptProposedAction()
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid File",
-                        "Please select a Python (.py) file."
-                    )
+        mime_data = event.mimeData()
+        if not mime_data.hasUrls():
+            return
+
+        urls = mime_data.urls()
+        if len(urls) != 1:
+            return
+
+        file_path = urls[0].toLocalFile()
+        if os.path.splitext(file_path)[1] in _ALLOWED_SUFFIXES:
+            self._set_selected_file(file_path)
+            event.acceptProposedAction()
+        else:
+            self._show_toast("Invalid file: please select a Python (.py) file.", 'warning')
 
     def _set_selected_file(self, file_path: str):
         """Set the selected file and update UI"""
+        file_name = os.path.basename(file_path)
         self.selected_file = file_path
-        self.file_label.setText(f"Selected: {Path(file_path).name}")
-        self.file_label.setStyleSheet("color: #000; font-style: normal;")
+        self.file_label.setText(f"Selected: {file_name}")
+        self.file_label.setStyleSheet(self._FILE_SELECTED_QSS)
         self.validate_btn.setEnabled(True)
         self.import_btn.setEnabled(False)
         self.validation_result = None
+        self._validated_code = None
         self.validation_display.setText("Click 'Validate Template' to check this file.")
         self.status_label.setText("")
 
         # Update drop area style
-        self.drop_area.setStyleSheet("""
-            QLabel {
-                border: 2px solid #4CAF50;
-                border-radius: 5px;
-                padding: 40px;
-                background-color: #f0f8f0;
-                min-height: 100px;
-            }
-        """)
-        self.drop_area.setText(f"✓ File selected: {Path(file_path).name}\n\nDrop another file to change")
+        self.drop_area.setStyleSheet(self._DROP_SELECTED_QSS)
+        self.drop_area.setText(f"✓ File selected: {file_name}\n\nDrop another file to change")
 
     def _validate_template(self):
-        """Validate the selected template file"""
+        """Validate the selected template file in a background thread"""
         if not self.selected_file:
             return
 
+        # Let a running validation finish before starting another, then
+        # validate the file selected in the meantime
+        if self._validation_thread is not None and self._validation_thread.isRunning():
+            self._revalidate = True
+            return
+
+        self._ensure_manager()
+
         try:
-            self.status_label.setText("Validating...")
-            self.validate_btn.setEnabled(False)
-
-            # Read file
-            with open(self.selected_file, 'r', encoding='utf-8') as f:
-                code = f.read()
-
-            # Validate
-            self.validation_result = self.template_manager.validate_template(code)
-
-            # Display results
-            result_text = []
-
-            if self.validation_result.valid:
-                result_text.append("✓ VALIDATION PASSED\n")
-                result_text.append("="  * 50)
-
-                if self.validation_result.metadata:
-                    result_text.append("\nTemplate Information:")
-                    result_text.append(f"  Name: {self.validation_result.metadata.get('name', 'N/A')}")
-                    result_text.append(f"  Description: {self.validation_result.metadata.get('description', 'N/A')}")
-                    result_text.append(f"  Category: {self.validation_result.metadata.get('category', 'N/A')}")
-                    result_text.append(f"  Version: {self.validation_result.metadata.get('version', '1.0.0')}")
-
-                    params = self.validation_result.metadata.get('parameters', {})
-                    result_text.append(f"\n  Parameters: {len(params)}")
-                    if params:
-                        for param_name in list(params.keys())[:5]:  # Show first 5
-                            result_text.append(f"    - {param_name}")
-                        if len(params) > 5:
-                            result_text.append(f"    ... and {len(params) - 5} more")
-
-                if self.validation_result.warnings:
-                    result_text.append("\n\nWarnings:")
-                    for warning in self.validation_result.warnings:
-                        result_text.append(f"  ⚠ {warning}")
-
-                result_text.append("\n\nTemplate is ready to import.")
-                self.import_btn.setEnabled(True)
-                self.status_label.setText("✓ Validation passed - Ready to import")
-                self.status_label.setStyleSheet("color: green; font-weight: bold;")
+            stat = os.stat(self.selected_file)
+        except OSError as e:
+            self._on_validation_finished(self.selected_file, "", None, str(e))
+            return
+        self._requested_key = (self.selected_file, stat.st_mtime_ns, stat.st_size)
 
-            else:
-                result_text.append("✗ VALIDATION FAILED\n")
-                result_text.append("=" * 50)
-                result_text.append("\nErrors:")
-                for error in self.validation_result.errors:
-                    result_text.append(f"  ✗ {error}")
+        # Unchanged since the last validation: _validate_file answers from its
+        # cache, so call it here instead of starting a thread
+        if self._requested_key == self._validated_key:
+            code, result = _validate_file(self.template_manager, *self._requested_key)
+            self._on_validation_finished(self.selected_file, code, result, "")
+            return
 
-                if self.validation_result.warnings:
-                    result_text.append("\nWarnings:")
-                    for warning in self.validation_result.warnings:
-                        result_text.append(f"  ⚠ {warning}")
+        self.status_label.setText("Validating...")
+        self.validate_btn.setEnabled(False)
+        self.import_btn.setEnabled(False)
 
-                result_text.append("\n\nPlease fix the errors before importing.")
-                self.import_btn.setEnabled(False)
-                self.status_label.setText("✗ Validation failed - Cannot import")
-                self.status_label.setStyleSheet("color: red; font-weight: bold;")
+        self._validation_thread = TemplateValidationThread(self.template_manager, *self._requested_key)
+        self._validation_thread.finished.connect(self._on_validation_finished)
+        self._validation_thread.start()
 
-            self.validation_display.setText("\n".join(result_text))
+    def _on_validation_finished(self, file_path: str, code: str, result, error: str):
+        """Display validation results from the background thread"""
+        self.validate_btn.setEnabled(self.selected_file is not None)
 
-        except Exception as e:
-            self.logger.error(f"Validation error: {e}")
-            self.validation_display.setText(f"Error during validation:\n\n{str(e)}")
+        revalidate, self._revalidate = self._revalidate, False
+
+        # Ignore results for a file that is no longer selected
+        if file_path != self.selected_file:
+            if revalidate and self.selected_file:
+                self._validation_thread.wait()
+                self._validate_template()
+            return
+
+        if error:
+            self.logger.error(f"Validation error: {error}")
+            self.validation_display.setText(f"Error during validation:\n\n{error}")
             self.status_label.setText("Error during validation")
-            self.status_label.setStyleSheet("color: red;")
+            self.status_label.setStyleSheet(self._STATUS_ERROR_QSS)
             self.import_btn.setEnabled(False)
+            return
 
-        finally:
-            self.validate_btn.setEnabled(True)
+        self.validation_result = result
+        self._validated_code = code  # Reused by import so the file isn't read twice
+        self._validated_key = self._requested_key
+
+        # Display results
+        buf = io.StringIO()
+
+        if self.validation_result.valid:
+            buf.write("✓ VALIDATION PASSED\n\n")
+            buf.write(_SEP + "\n")
+
+            if self.validation_result.metadata:
+                metadata = self.validation_result.metadata
+                buf.write(_META_TEMPLATE.format_map(ChainMap(metadata, _META_DEFAULTS)))
+
+                params = metadata.get('parameters', {})
+                buf.write(f"\n  Parameters: {len(params)}\n")
+                if params:
+                    for param_name in islice(params, 5):  # Show first 5
+                        buf.write(f"    - {param_name}\n")
+                    if len(params) > 5:
+                        buf.write(f"    ... and {len(params) - 5} more\n")
+
+            if self.validation_result.warnings:
+                buf.write("\n\nWarnings:\n")
+                for warning in self.validation_result.warnings:
+                    buf.write(f"  ⚠ {warning}\n")
+
+            buf.write("\n\nTemplate is ready to import.")
+            self.import_btn.setEnabled(True)
+            self.status_label.setText("✓ Validation passed - Ready to import")
+            self.status_label.setStyleSheet(self._STATUS_OK_QSS)
+
+        else:
+            buf.write("✗ VALIDATION FAILED\n\n")
+            buf.write(_SEP + "\n")
+            buf.write("\nErrors:\n")
+            for error in self.validation_result.errors:
+                buf.write(f"  ✗ {error}\n")
+
+            if self.validation_result.warnings:
+                buf.write("\nWarnings:\n")
+                for warning in self.validation_result.warnings:
+                    buf.write(f"  ⚠ {warning}\n")
+
+            buf.write("\n\nPlease fix the errors before importing.")
+            self.import_btn.setEnabled(False)
+            self.status_label.setText("✗ Validation failed - Cannot import")
+            self.status_label.setStyleSheet(self._STATUS_FAIL_QSS)
+
+        self.validation_display.setText(buf.getvalue())
 
     def _import_template(self):
         """Import the validated template"""
-        if not self.selected_file or not self.validation_result or not self.validation_result.valid:
-            QMessageBox.warning(
-                self,
-                "Cannot Import",
-                "Please select and validate a template file first."
-            )
+        was_valid = bool(self.validation_result and self.validation_result.valid)
+        if not self.selected_file or not was_valid:
+            self._show_toast("Cannot import: please select and validate a template file first.", 'warning')
             return
 
+        self._ensure_manager()
+
         try:
             self.status_label.setText("Importing...")
             self.import_btn.setEnabled(False)
@@ -285,38 +435,37 @@ class TemplateUploaderWidget(QWidget):
             category = self.category_combo.currentText()
 
             # Import template
-            imported_path = self.template_manager.import_template(self.selected_file, category)
+            imported_path = self.template_manager.import_template(
+                self.selected_file,
+                category,
+                source_code=self._validated_code,
+                validation=self.validation_result
+            )
 
             if imported_path:
                 self.logger.info(f"Template imported: {imported_path}")
 
                 # Show success message
                 template_name = self.validation_result.metadata.get('name', 'Template')
-                QMessageBox.information(
-                    self,
-                    "Import Successful",
-                    f"Template '{template_name}' has been imported successfully!\n\n"
-                    f"Category: {category}\n"
-                    f"Location: {Path(imported_path).name}\n\n"
-                    "The template is now available in your script library."
+                self._show_toast(
+                    f"Template '{template_name}' imported into {category} "
+                    f"as {os.path.basename(imported_path)}. "
+                    "It is now available in your script library.",
+                    'success'
                 )
 
                 self.status_label.setText("✓ Import successful")
-                self.status_label.setStyleSheet("color: green; font-weight: bold;")
+                self.status_label.setStyleSheet(self._STATUS_OK_QSS)
 
                 # Emit signal
                 self.template_imported.emit(imported_path)
 
                 # Clear for next import
-                self._clear()
+                self._reset_state()
             else:
-                QMessageBox.critical(
-                    self,
-                    "Import Failed",
-                    "Failed to import template. Check logs for details."
-                )
+                self._show_toast("Failed to import template. Check logs for details.", 'error')
                 self.status_label.setText("✗ Import failed")
-                self.status_label.setStyleSheet("color: red;")
+                self.status_label.setStyleSheet(self._STATUS_ERROR_QSS)
 
         except Exception as e:
             self.logger.error(f"Import error: {e}")
@@ -326,17 +475,40 @@ class TemplateUploaderWidget(QWidget):
                 f"An error occurred during import:\n\n{str(e)}"
             )
             self.status_label.setText("Error during import")
-            self.status_label.setStyleSheet("color: red;")
+            self.status_label.setStyleSheet(self._STATUS_ERROR_QSS)
 
         finally:
-            self.import_btn.setEnabled(self.validation_result and self.validation_result.valid)
+            self.import_btn.setEnabled(was_valid and self.selected_file is not None)
+
+    def _show_toast(self, text: str, kind: str = 'success'):
+        """
+        Show a short-lived notification banner without blocking the event loop
+
+        Args:
+            text: Message to show
+            kind: 'success', 'warning' or 'error'
+        """
+        self._toast.setText(text)
+        self._toast.setStyleSheet(self._TOAST_QSS[kind])
+        self._toast.show()
+        self._toast_timer.start(3000)
 
     def _clear(self):
         """Clear the uploader"""
+        # Nothing to reset if no file is selected or validated
+        if self.selected_file is None and self.validation_result is None:
+            return
+
+        self._reset_state()
+
+    def _reset_state(self):
+        """Reset the uploader to its initial state"""
         self.selected_file = None
         self.validation_result = None
+        self._validated_code = None
+        self._validated_key = None
         self.file_label.setText("No file selected")
-        self.file_label.setStyleSheet("color: #666; font-style: italic;")
+        self.file_label.setStyleSheet(self._DIM_QSS)
         self.validation_display.setText("No file validated yet.")
         self.validate_btn.setEnabled(False)
         self.import_btn.setEnabled(False)
@@ -344,13 +516,5 @@ class TemplateUploaderWidget(QWidget):
         self.category_combo.setCurrentText('Custom')
 
         # Reset drop area
-        self.drop_area.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #999;
-                border-radius: 5px;
-                padding: 40px;
-                background-color: #f5f5f5;
-                min-height: 100px;
-            }
-        """)
+        self.drop_area.setStyleSheet(self._DROP_IDLE_QSS)
         self.drop_area.setText("Drag and drop template file here\n\nOR")
@@ -5,21 +5,82 @@ Allows users to describe workflows in natural language and generates Python scri
 """
 
 import logging
+import os
+import re
+import sys
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
+    QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, QPlainTextEdit, QPushButton,
     QLabel, QGroupBox, QLineEdit, QComboBox, QMessageBox,
     QSplitter, QCheckBox, QProgressBar, QTabWidget, QWidget
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QThread
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QThread, QTimer
 from PyQt5.QtGui import QFont, QTextCharFormat, QColor, QSyntaxHighlighter
 
+from .settings_dialog import SettingsDialog
+
+
+# Directory generated workflows are saved to (user_scripts/custom)
+_CUSTOM_SCRIPTS_DIR = Path(__file__).parent.parent.parent / "user_scripts" / "custom"
+_custom_dir_ready = False  # Set once _CUSTOM_SCRIPTS_DIR has been created
+_WRITE_FLAGS = os.O_WRONLY | getattr(os, 'O_BINARY', 0)  # No newline translation on Windows
+
+# Workflow name -> file name: anything but letters, digits, spaces and
+# underscores becomes '_' (ASCII via the table, the rest via the regex)
+_SAFE_FILENAME_TABLE = {
+    cp: '_' for cp in range(128) if not (chr(cp).isalnum() or chr(cp) in ' _')
+}
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w ]')
+
+# Singleton getters of the core modules, resolved on first use so opening the
+# dialog doesn't import the AI generator and its SDK dependencies
+_get_ai_workflow_generator = None
+_get_template_manager = None
+
+
+def _write_fd(fd: int, data: bytes):
+    """Write all of data to fd without a file object, then close fd"""
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _ai_generator():
+    """Get the shared AIWorkflowGenerator, importing its module on first call"""
+    global _get_ai_workflow_generator
+    if _get_ai_workflow_generator is None:
+        from core.ai_workflow_generator import get_ai_workflow_generator
+        _get_ai_workflow_generator = get_ai_workflow_generator
+    return _get_ai_workflow_generator()
+
+
+def _template_manager():
+    """Get the shared TemplateManager, importing its module on first call"""
+    global _get_template_manager
+    if _get_template_manager is None:
+        from core.template_manager import get_template_manager
+        _get_template_manager = get_template_manager
+    return _get_template_manager()
+
 
 class PythonSyntaxHighlighter(QSyntaxHighlighter):
     """Simple Python syntax highlighter for code preview"""
 
+    KEYWORDS = [
+        'def', 'class', 'return', 'if', 'elif', 'else', 'for', 'while',
+        'try', 'except', 'finally', 'import', 'from', 'as', 'with',
+        'True', 'False', 'None', 'and', 'or', 'not', 'in', 'is'
+    ]
+
+    _KEYWORD_SET = frozenset(sys.intern(k) for k in KEYWORDS)
+    _KEYWORD_INITIALS = frozenset(k[0] for k in KEYWORDS)  # Words starting elsewhere skip the lookup
+
     def __init__(self, document):
         super().__init__(document)
         self.setup_formats()
@@ -30,11 +91,7 @@ class PythonSyntaxHighlighter(QSyntaxHighlighter):
         self.keyword_format = QTextCharFormat()
         self.keyword_format.setForeground(QColor("#0000FF"))
         self.keyword_format.setFontWeight(QFont.Bold)
-        self.keywords = [
-            'def', 'class', 'return', 'if', 'elif', 'else', 'for', 'while',
-            'try', 'except', 'finally', 'import', 'from', 'as', 'with',
-            'True', 'False', 'None', 'and', 'or', 'not', 'in', 'is'
-        ]
+        self.keywords = self.KEYWORDS
 
         # Strings
         self.string_format = QTextCharFormat()
@@ -46,129 +103,149 @@ class PythonSyntaxHighlighter(QSyntaxHighlighter):
         self.comment_format.setFontItalic(True)
 
     def highlightBlock(self, text):
-        """Apply highlighting to a block of text"""
-        # Highlight keywords
-        for keyword in self.keywords:
-            index = text.find(keyword)
-            while index >= 0:
-                length = len(keyword)
-                self.setFormat(index, length, self.keyword_format)
-                index = text.find(keyword, index + length)
-
-        # Highlight strings
-        for quote in ['"', "'"]:
-            index = text.find(quote)
-            while index >= 0:
-                end_index = text.find(quote, index + 1)
-                if end_index == -1:
-                    break
-                length = end_index - index + 1
-                self.setFormat(index, length, self.string_format)
-                index = text.find(quote, end_index + 1)
-
-        # Highlight comments
-        index = text.find('#')
-        if index >= 0:
-            self.setFormat(index, len(text) - index, self.comment_format)
-
-
-class WorkflowGeneratorThread(QThread):
-    """Thread for generating workflows using AI"""
-
-    finished = pyqtSignal(dict)  # Emits {success: bool, code: str, error: str}
-    progress = pyqtSignal(str)   # Emits progress messages
-
-    def __init__(self, description: str, category: str, use_templates: list):
-        super().__init__()
-        self.description = description
-        self.category = category
-        self.use_templates = use_templates
-        self.logger = logging.getLogger(__name__)
-
-    def run(self):
-        """Generate the workflow"""
-        try:
-            self.progress.emit("Analyzing your requirements...")
-
-            # Import AI generator
-            from core.ai_workflow_generator import AIWorkflowGenerator
-
-            generator = AIWorkflowGenerator()
-
-            self.progress.emit("Generating workflow code...")
-
-            # Generate the workflow
-            result = generator.generate_workflow(
-                description=self.description,
-                category=self.category,
-                use_templates=self.use_templates
-            )
-
-            self.progress.emit("Workflow generated successfully!")
-
-            self.finished.emit({
-                'success': True,
-                'code': result.get('code', ''),
-                'name': result.get('name', 'Generated Workflow'),
-                'description': result.get('description', ''),
-                'parameters': result.get('parameters', {}),
-                'error': ''
-            })
-
-        except Exception as e:
-            self.logger.error(f"Workflow generation failed: {e}")
-            self.finished.emit({
-                'success': False,
-                'code': '',
-                'error': str(e)
-            })
-
-
-class TemplateCustomizerThread(QThread):
-    """Thread for customizing templates using AI"""
+        """Apply highlighting to a block of text in a single left-to-right pass"""
+        # Nothing to format on blank lines
+        if not text or text.isspace():
+            return
 
-    finished = pyqtSignal(dict)  # Emits {success: bool, code: str, error: str}
-    progress = pyqtSignal(str)   # Emits progress messages
+        # Comment-only line: one format call, no scan
+        code = text.lstrip()
+        if code[0] == '#':
+            self.setFormat(len(text) - len(code), len(code), self.comment_format)
+            return
 
-    def __init__(self, template_code: str, customization_request: str, template_metadata: dict):
+        keywords = self._KEYWORD_SET
+        initials = self._KEYWORD_INITIALS
+        length = len(text)
+        i = 0
+        while i < length:
+            ch = text[i]
+
+            # Comment: '#' outside a string runs to the end of the line
+            if ch == '#':
+                self.setFormat(i, length - i, self.comment_format)
+                break
+
+            # String: scan to the matching unescaped quote (or end of line)
+            if ch == '"' or ch == "'":
+                j = i + 1
+                while j < length and text[j] != ch:
+                    j += 2 if text[j] == '\\' else 1
+                end = min(j + 1, length)
+                self.setFormat(i, end - i, self.string_format)
+                i = end
+                continue
+
+            # Word: keywords are looked up in a frozenset
+            if ch.isalnum() or ch == '_':
+                j = i + 1
+                while j < length and (text[j].isalnum() or text[j] == '_'):
+                    j += 1
+                if ch in initials and text[i:j] in keywords:
+                    self.setFormat(i, j - i, self.keyword_format)
+                i = j
+                continue
+
+            i += 1
+
+
+# use_templates argument for generate_workflow when "use templates" is checked
+_USE_TEMPLATES_ALL = ('all',)
+
+# Progress messages and the default workflow name for each AIWorkflowGenerator
+# method run by AIWorkerThread: (starting, working, done, default name, streams).
+# A None default name means the method already returns the {success, code, error}
+# form; methods that stream accept an on_text callback for the partial response.
+_AI_TASKS = {
+    'generate_workflow': (
+        "Analyzing your requirements...", "Generating workflow code...",
+        "Workflow generated successfully!", 'Generated Workflow', True
+    ),
+    'customize_template': (
+        "Loading template...", "Customizing template with AI...",
+        "Template customized successfully!", 'Customized Workflow', True
+    ),
+    'generate_from_document': (
+        "Analyzing document structure...", "Generating Python template code with AI...",
+        "Template generated successfully!", None, False
+    ),
+}
+
+
+class AIWorkerThread(QThread):
+    """Thread for running an AIWorkflowGenerator method in the background"""
+
+    finished = pyqtSignal(dict)  # Emits {success: bool, code: str, error: str, ...}
+    progress = pyqtSignal(str)   # Emits progress messages (on the GUI thread)
+    code_chunk = pyqtSignal(str)  # Emits chunks of the AI response as it streams in
+    _progress_posted = pyqtSignal()  # Worker -> GUI thread: a new progress message is waiting
+
+    def __init__(self, method_name: str, **kwargs):
+        """
+        Args:
+            method_name: AIWorkflowGenerator method to call (a key of _AI_TASKS)
+            **kwargs: Keyword arguments for the method
+        """
         super().__init__()
-        self.template_code = template_code
-        self.customization_request = customization_request
-        self.template_metadata = template_metadata
+        self.method_name = method_name
+        self.kwargs = kwargs
         self.logger = logging.getLogger(__name__)
 
+        # Progress messages are coalesced: the worker only posts to the GUI
+        # thread when the previous message has been picked up
+        self._latest_progress = ""
+        self._progress_pending = False
+        self._progress_posted.connect(self._flush_progress, Qt.QueuedConnection)
+
+    def _report_progress(self, message: str):
+        """Record a progress message from the worker thread"""
+        self._latest_progress = message
+        if not self._progress_pending:
+            self._progress_pending = True
+            self._progress_posted.emit()
+
+    @pyqtSlot()
+    def _flush_progress(self):
+        """Emit the latest progress message on the GUI thread"""
+        # Clear the flag before reading so a message posted meanwhile isn't lost
+        self._progress_pending = False
+        self.progress.emit(self._latest_progress)
+
     def run(self):
-        """Customize the template"""
+        """Call the generator method and emit its normalized result"""
+        starting, working, done, default_name, streams = _AI_TASKS[self.method_name]
         try:
-            self.progress.emit("Loading template...")
+            self._report_progress(starting)
 
-            # Import AI generator
-            from core.ai_workflow_generator import AIWorkflowGenerator
+            # Shared AI generator (its module is imported on first use)
+            generator = _ai_generator()
 
-            generator = AIWorkflowGenerator()
+            self._report_progress(working)
 
-            self.progress.emit("Customizing template with AI...")
+            kwargs = dict(self.kwargs, on_text=self.code_chunk.emit) if streams else self.kwargs
+            result = getattr(generator, self.method_name)(**kwargs)
 
-            # Customize the template
-            result = generator.customize_template(
-                template_code=self.template_code,
-                customization_request=self.customization_request,
-                template_metadata=self.template_metadata
-            )
+            if default_name is None:
+                if result.get('success'):
+                    self._report_progress(done)
+                else:
+                    self._report_progress(f"Generation failed: {result.get('error', 'Unknown error')}")
+                self.finished.emit(result)
+                return
 
-            self.progress.emit("Template customized successfully!")
+            self._report_progress(done)
 
             self.finished.emit({
                 'success': True,
                 'code': result.get('code', ''),
-                'name': result.get('name', 'Customized Workflow'),
+                'name': result.get('name', default_name),
                 'description': result.get('description', ''),
                 'parameters': result.get('parameters', {}),
                 'error': ''
             })
 
         except Exception as e:
-            self.logger.error(f"Template customization failed: {e}")
+            self.logger.error(f"AI task {self.method_name} failed: {e}")
             self.finished.emit({
                 'success': False,
                 'code': '',
@@ -176,48 +253,85 @@ class TemplateCustomizerThread(QThread):
             })
 
 
-class TemplateGeneratorThread(QThread):
+class TemplateGeneratorThread(AIWorkerThread):
     """Thread for generating templates from documents using AI"""
 
-    finished = pyqtSignal(dict)  # Emits {success: bool, code: str, name: str, error: str}
-    progress = pyqtSignal(str)   # Emits progress messages
-
     def __init__(self, analysis: dict, user_instructions: str = ""):
-        super().__init__()
-        self.analysis = analysis
-        self.user_instructions = user_instructions
-        self.logger = logging.getLogger(__name__)
-
-    def run(self):
-        """Generate template from document analysis"""
-        try:
-            self.progress.emit("Analyzing document structure...")
-
-            # Import AI generator
-            from core.ai_workflow_generator import AIWorkflowGenerator
+        super().__init__('generate_from_document', analysis=analysis, user_instructions=user_instructions)
+
+
+def _recommendation_dicts(templates: list) -> list:
+    """Convert discovered templates to the format expected by recommend_templates"""
+    return [
+        {
+            'id': t.id,
+            'name': t.name,
+            'description': t.description,
+            'category': t.category,
+            'parameters': t.parameters,
+            'tags': getattr(t, 'tags', []),
+            'file_path': t.file_path
+        }
+        for t in templates
+    ]
 
-            generator = AIWorkflowGenerator()
 
-            self.progress.emit("Generating Python template code with AI...")
+class TemplateRecommendationThread(QThread):
+    """Thread for discovering templates and recommending them for a description"""
 
-            # Generate the template
-            result = generator.generate_from_document(
-                analysis=self.analysis,
-                user_instructions=self.user_instructions
-            )
+    finished = pyqtSignal(int, dict)  # Emits (request_id, {success, description, signature, templates, ...})
 
-            if result.get('success'):
-                self.progress.emit("Template generated successfully!")
-            else:
-                self.progress.emit(f"Generation failed: {result.get('error', 'Unknown error')}")
+    def __init__(self, request_id: int, description: str, template_manager,
+                 templates: list, template_dicts: list, signature, recommendation_cache: dict):
+        super().__init__()
+        self.request_id = request_id
+        self.description = description
+        self.template_manager = template_manager
+        self.templates = templates
+        self.template_dicts = template_dicts
+        self.signature = signature
+        self.recommendation_cache = recommendation_cache
+        self.logger = logging.getLogger(__name__)
 
-            self.finished.emit(result)
+    def run(self):
+        """Discover templates (if changed) and recommend them"""
+        try:
+            # Rediscover only if the template files changed since the last run
+            signature = self.template_manager.templates_signature()
+            templates = self.templates
+            template_dicts = self.template_dicts
+            if signature != self.signature:
+                templates = self.template_manager.discover_templates()
+
+                template_dicts = _recommendation_dicts(templates)  # Once per discovery
+
+            # The cache is only written on the GUI thread; reading it here is safe
+            recommendations = self.recommendation_cache.get((self.description, signature))
+
+            if recommendations is None:
+                # Flatten {template, score, reason} entries for display
+                recommendations = [
+                    {**rec['template'], 'score': rec['score'], 'reason': rec['reason']}
+                    for rec in _ai_generator().recommend_templates(
+                        self.description, template_dicts
+                    )
+                ]
+
+            self.finished.emit(self.request_id, {
+                'success': True,
+                'description': self.description,
+                'signature': signature,
+                'templates': templates,
+                'template_dicts': template_dicts,
+                'recommendations': recommendations,
+                'error': ''
+            })
 
         except Exception as e:
-            self.logger.error(f"Template generation failed: {e}")
-            self.finished.emit({
+            self.logger.error(f"Template recommendation failed: {e}")
+            self.finished.emit(self.request_id, {
                 'success': False,
-                'code': '',
+                'description': self.description,
                 'error': str(e)
             })
 
@@ -227,18 +341,59 @@ class WorkflowGeneratorDialog(QDialog):
 
     workflow_created = pyqtSignal(str)  # Emits the path to the created workflow file
 
+    RECOMMENDATION_CACHE_SIZE = 32
+    MAX_RECOMMENDATIONS = 3  # Recommendation rows shown under the description
+
+    # Recommendation row styles, set once on the rows' container and matched by object name
+    _RECOMMENDATION_QSS = """
+        QWidget#recRow {
+            background-color: #f0f8ff;
+            border: 1px solid #b0d4f1;
+            border-radius: 5px;
+            padding: 8px;
+        }
+        QWidget#recRow:hover {
+            background-color: #e0f0ff;
+            border-color: #5dade2;
+        }
+        QLabel#recCategory {
+            color: #666;
+        }
+        QLabel#recScore {
+            background-color: #4CAF50;
+            color: white;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-size: 10px;
+        }
+        QLabel#recReason {
+            color: #444;
+            font-size: 10px;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
         self.generated_code = ""
         self.generated_metadata = {}
         self.generator_thread = None
+        self._streaming_preview = False  # Preview shows a partial AI response
         self.loaded_template = None  # Track if a template is currently loaded
         self.loaded_template_code = None  # Original template code for customization
 
-        # Initialize template manager for loading templates
-        from core.template_manager import TemplateManager
-        self.template_manager = TemplateManager()
+        # Shared template manager for loading templates
+        self.template_manager = _template_manager()
+
+        # Discovery and recommendation results, reused while template files are unchanged
+        self._templates_signature = None
+        self._templates = []
+        self._template_dicts = []  # self._templates in the format recommend_templates expects
+        self._template_by_path = {}  # file_path -> Template for self._templates
+        self._recommendation_cache = OrderedDict()  # (description, signature) -> recommendations
+        self._last_recs_text = None  # Description the recommendations were last computed for
+        self._recs_request_id = 0  # Id of the latest recommendation request
+        self._recs_threads = []  # Recommendation threads kept alive until they finish
 
         self.setWindowTitle("Workflow & Template Manager")
         self.resize(1000, 700)
@@ -284,6 +439,13 @@ class WorkflowGeneratorDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def done(self, result: int):
+        """Wait for in-flight recommendation threads before the dialog closes"""
+        for thread in self._recs_threads:
+            thread.wait()
+        self._recs_threads = []
+        super().done(result)
+
     def _create_generator_tab(self):
         """Create the AI generator tab"""
         tab = QWidget()
@@ -325,6 +487,10 @@ class WorkflowGeneratorDialog(QDialog):
             "Desktop Automation",
             "Custom"
         ])
+        # Category name -> combo index, for selecting a loaded template's category
+        self._category_index = {
+            self.category_combo.itemText(i): i for i in range(self.category_combo.count())
+        }
         options_layout.addWidget(self.category_combo)
 
         options_layout.addStretch()
@@ -355,14 +521,25 @@ class WorkflowGeneratorDialog(QDialog):
         self.recommendations_container_layout = QVBoxLayout(self.recommendations_container)
         self.recommendations_container_layout.setContentsMargins(0, 0, 0, 0)
         self.recommendations_container_layout.setSpacing(5)
+        self.recommendations_container.setStyleSheet(self._RECOMMENDATION_QSS)
+
+        # Rows are built once and refilled on every refresh
+        self._rec_rows = [self._create_recommendation_row() for _ in range(self.MAX_RECOMMENDATIONS)]
+        for row in self._rec_rows:
+            self.recommendations_container_layout.addWidget(row)
         recommendations_layout.addWidget(self.recommendations_container)
 
         self.recommendations_group.setLayout(recommendations_layout)
         self.recommendations_group.setVisible(False)  # Hidden initially
         layout.addWidget(self.recommendations_group)
 
-        # Connect description input to recommendation trigger
-        self.description_input.textChanged.connect(self._on_description_changed)
+        # Connect description input to recommendation trigger, debounced so a
+        # burst of keystrokes only refreshes recommendations once
+        self._recs_timer = QTimer(self)
+        self._recs_timer.setSingleShot(True)
+        self._recs_timer.setInterval(400)
+        self._recs_timer.timeout.connect(self._on_description_changed)
+        self.description_input.textChanged.connect(self._recs_timer.start)
 
         # Generate button
         generate_btn_layout = QHBoxLayout()
@@ -373,6 +550,12 @@ class WorkflowGeneratorDialog(QDialog):
         self.generate_btn.clicked.connect(self.generate_workflow)
         generate_btn_layout.addWidget(self.generate_btn)
 
+        self.regenerate_btn = QPushButton("Regenerate")
+        self.regenerate_btn.setToolTip("Ask the AI again instead of reusing its previous answer")
+        self.regenerate_btn.setEnabled(False)
+        self.regenerate_btn.clicked.connect(self.regenerate_workflow)
+        generate_btn_layout.addWidget(self.regenerate_btn)
+
         generate_btn_layout.addStretch()
         layout.addLayout(generate_btn_layout)
 
@@ -402,7 +585,7 @@ class WorkflowGeneratorDialog(QDialog):
         preview_layout.addLayout(metadata_layout)
 
         # Code preview
-        self.code_preview = QTextEdit()
+        self.code_preview = QPlainTextEdit()
         self.code_preview.setReadOnly(True)
         self.code_preview.setFont(QFont("Courier New", 9))
         self.code_preview.setMinimumHeight(250)
@@ -483,86 +666,101 @@ class WorkflowGeneratorDialog(QDialog):
         # Don't show recommendations if a template is already loaded
         if self.loaded_template:
             self.recommendations_group.setVisible(False)
+            self._last_recs_text = None
             return
 
         description = self.description_input.toPlainText().strip()
 
+        # Skip edits that don't change the trimmed text (e.g. trailing whitespace)
+        if description == self._last_recs_text:
+            return
+        self._last_recs_text = description
+
         # Only show recommendations if description has enough text (at least 10 chars)
         if len(description) < 10:
             self.recommendations_group.setVisible(False)
             return
 
-        # Get template recommendations
+        # Get template recommendations in the background; older requests still
+        # running are left to finish and their results are dropped
+        self._recs_request_id += 1
+        self._recs_threads = [t for t in self._recs_threads if t.isRunning()]
+
+        thread = TemplateRecommendationThread(
+            self._recs_request_id,
+            description,
+            self.template_manager,
+            self._templates,
+            self._template_dicts,
+            self._templates_signature,
+            self._recommendation_cache
+        )
+        thread.finished.connect(self._on_recommendations_ready)
+        self._recs_threads.append(thread)
+        thread.start()
+
+    def _on_recommendations_ready(self, request_id: int, result: dict):
+        """Cache and display recommendations from the background thread"""
+        if not result['success']:
+            self.logger.error(f"Failed to get template recommendations: {result['error']}")
+            if request_id == self._recs_request_id:
+                self.recommendations_group.setVisible(False)
+            return
+
+        # Remember discovery and recommendation results for later requests
+        if result['signature'] != self._templates_signature:
+            self._templates = result['templates']
+            self._template_dicts = result['template_dicts']
+            self._template_by_path = {t.file_path: t for t in self._templates}
+            self._templates_signature = result['signature']
+
+        cache_key = (result['description'], result['signature'])
+        self._recommendation_cache[cache_key] = result['recommendations']
+        self._recommendation_cache.move_to_end(cache_key)
+        if len(self._recommendation_cache) > self.RECOMMENDATION_CACHE_SIZE:
+            self._recommendation_cache.popitem(last=False)
+
+        # Drop results superseded by newer typing or a loaded template
+        if request_id != self._recs_request_id or self.loaded_template:
+            return
+
+        # Display recommendations
         try:
-            from core.ai_workflow_generator import AIWorkflowGenerator
-
-            generator = AIWorkflowGenerator()
-
-            # Discover all templates
-            templates = self.template_manager.discover_templates()
-
-            # Convert to format expected by recommend_templates
-            template_dicts = []
-            for template in templates:
-                template_dicts.append({
-                    'id': template.id,
-                    'name': template.name,
-                    'description': template.description,
-                    'category': template.category,
-                    'parameters': template.parameters,
-                    'tags': template.tags if hasattr(template, 'tags') else [],
-                    'file_path': template.file_path
-                })
-
-            # Get recommendations
-            recommendations = generator.recommend_templates(description, template_dicts)
-
-            # Display recommendations
+            recommendations = result['recommendations']
             if recommendations:
-                self._display_recommendations(recommendations[:3])  # Top 3
+                self._display_recommendations(recommendations[:self.MAX_RECOMMENDATIONS])
                 self.recommendations_group.setVisible(True)
             else:
                 self.recommendations_group.setVisible(False)
 
         except Exception as e:
-            self.logger.error(f"Failed to get template recommendations: {e}")
+            self.logger.error(f"Failed to display template recommendations: {e}")
             self.recommendations_group.setVisible(False)
 
     def _display_recommendations(self, recommendations: list):
-        """Display template recommendations in the UI"""
-        # Clear existing recommendations
-        for i in reversed(range(self.recommendations_container_layout.count())):
-            widget = self.recommendations_container_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
+        """Display template recommendations in the pre-built recommendation rows"""
         # Update header text
         self.recommendations_label.setText(
             f"Found {len(recommendations)} relevant template(s) for your description:"
         )
         self.recommendations_label.setStyleSheet("color: #000; font-weight: bold;")
 
-        # Add recommendation items
-        for rec in recommendations:
-            rec_widget = self._create_recommendation_widget(rec)
-            self.recommendations_container_layout.addWidget(rec_widget)
+        # Fill one row per recommendation and hide the rest
+        for i, row in enumerate(self._rec_rows):
+            if i < len(recommendations):
+                self._fill_recommendation_row(row, recommendations[i])
+                row.setVisible(True)
+            else:
+                row.recommendation = None
+                row.setVisible(False)
 
-    def _create_recommendation_widget(self, recommendation: dict) -> QWidget:
-        """Create a widget for a single recommendation"""
+    def _create_recommendation_row(self) -> QWidget:
+        """Create an empty, hidden widget for showing a single recommendation"""
         widget = QWidget()
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: #f0f8ff;
-                border: 1px solid #b0d4f1;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            QWidget:hover {
-                background-color: #e0f0ff;
-                border-color: #5dade2;
-            }
-        """)
+        widget.setObjectName('recRow')  # Styled by _RECOMMENDATION_QSS
+        widget.setAttribute(Qt.WA_StyledBackground, True)
         widget.setCursor(Qt.PointingHandCursor)
+        widget.recommendation = None  # Recommendation currently shown in the row
 
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(8, 8, 8, 8)
@@ -571,57 +769,54 @@ class WorkflowGeneratorDialog(QDialog):
         # Template name and category
         header_layout = QHBoxLayout()
 
-        name_label = QLabel(f"📋 {recommendation['name']}")
+        widget.name_label = QLabel()
         name_font = QFont()
         name_font.setBold(True)
-        name_label.setFont(name_font)
-        header_layout.addWidget(name_label)
+        widget.name_label.setFont(name_font)
+        header_layout.addWidget(widget.name_label)
 
-        category_label = QLabel(f"[{recommendation['category']}]")
-        category_label.setStyleSheet("color: #666;")
-        header_layout.addWidget(category_label)
+        widget.category_label = QLabel()
+        widget.category_label.setObjectName('recCategory')
+        header_layout.addWidget(widget.category_label)
 
         header_layout.addStretch()
 
         # Score badge
-        score = recommendation.get('score', 0)
-        score_label = QLabel(f"{score}% match")
-        score_label.setStyleSheet("""
-            background-color: #4CAF50;
-            color: white;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-size: 10px;
-        """)
-        header_layout.addWidget(score_label)
+        widget.score_label = QLabel()
+        widget.score_label.setObjectName('recScore')
+        header_layout.addWidget(widget.score_label)
 
         layout.addLayout(header_layout)
 
         # Reason
-        reason_label = QLabel(f"💡 {recommendation['reason']}")
-        reason_label.setWordWrap(True)
-        reason_label.setStyleSheet("color: #444; font-size: 10px;")
-        layout.addWidget(reason_label)
+        widget.reason_label = QLabel()
+        widget.reason_label.setWordWrap(True)
+        widget.reason_label.setObjectName('recReason')
+        layout.addWidget(widget.reason_label)
 
-        # Click action - load this template
+        # Click action - load the template the row currently shows
         def on_click(event):
-            self._load_recommended_template(recommendation)
+            if widget.recommendation is not None:
+                self._load_recommended_template(widget.recommendation)
 
         widget.mousePressEvent = on_click
 
+        widget.setVisible(False)
         return widget
 
+    def _fill_recommendation_row(self, row: QWidget, recommendation: dict):
+        """Show a recommendation in a pre-built recommendation row"""
+        row.recommendation = recommendation
+        row.name_label.setText(f"📋 {recommendation['name']}")
+        row.category_label.setText(f"[{recommendation['category']}]")
+        row.score_label.setText(f"{recommendation.get('score', 0)}% match")
+        row.reason_label.setText(f"💡 {recommendation['reason']}")
+
     def _load_recommended_template(self, recommendation: dict):
         """Load a recommended template"""
         try:
-            # Find the template object by file_path
-            templates = self.template_manager.discover_templates()
-            template = None
-
-            for t in templates:
-                if t.file_path == recommendation['file_path']:
-                    template = t
-                    break
+            # Recommendations come from the last discovery, so look the template up there
+            template = self._template_by_path.get(recommendation['file_path'])
 
             if template:
                 # Use existing template selection handler
@@ -641,10 +836,18 @@ class WorkflowGeneratorDialog(QDialog):
                 f"Failed to load template:\n\n{str(e)}"
             )
 
+    def _set_preview_code(self, code: str):
+        """Show code in the preview, highlighting it in one pass once it is installed"""
+        self.code_preview.blockSignals(True)
+        self.highlighter.setDocument(None)
+        try:
+            self.code_preview.setPlainText(code)
+        finally:
+            self.highlighter.setDocument(self.code_preview.document())
+            self.code_preview.blockSignals(False)
+
     def _on_template_selected(self, template):
         """Handle template selection for customization"""
-        from core.template_manager import Template
-
         # Load template code
         full_template = self.template_manager.load_template(template.file_path)
 
@@ -678,18 +881,16 @@ class WorkflowGeneratorDialog(QDialog):
         self.description_input.setPlainText(description)
 
         # Set category
-        category_index = self.category_combo.findText(template.category)
-        if category_index >= 0:
-            self.category_combo.setCurrentIndex(category_index)
-        else:
-            self.category_combo.setCurrentText("Custom")
+        self.category_combo.setCurrentIndex(
+            self._category_index.get(template.category, self._category_index["Custom"])
+        )
 
         # Track loaded template for customization
         self.loaded_template = template
         self.loaded_template_code = full_template.code
 
         # Display template code in preview
-        self.code_preview.setPlainText(full_template.code)
+        self._set_preview_code(full_template.code)
         self.generated_code = full_template.code
         self.generated_metadata = {
             'name': template.name,
@@ -708,6 +909,7 @@ class WorkflowGeneratorDialog(QDialog):
 
         # Update Generate button text to indicate customization mode
         self.generate_btn.setText("Customize Template with AI")
+        self.regenerate_btn.setEnabled(False)
 
         # Hide recommendations when template is loaded
         self.recommendations_group.setVisible(False)
@@ -742,13 +944,20 @@ class WorkflowGeneratorDialog(QDialog):
         # Disable save buttons
         self.save_btn.setEnabled(False)
         self.save_and_run_btn.setEnabled(False)
+        self.regenerate_btn.setEnabled(False)
 
         # Trigger recommendations refresh if there's description text
+        self._last_recs_text = None
         if self.description_input.toPlainText().strip():
             self._on_description_changed()
 
-    def generate_workflow(self):
-        """Generate workflow from description or customize loaded template"""
+    @pyqtSlot()
+    def generate_workflow(self, use_cache: bool = True):
+        """Generate workflow from description or customize loaded template
+
+        Args:
+            use_cache: If False, don't reuse a cached AI response for the same request
+        """
         description = self.description_input.toPlainText().strip()
 
         if not description:
@@ -759,8 +968,13 @@ class WorkflowGeneratorDialog(QDialog):
             )
             return
 
-        # Disable generate button during generation
+        # Only one generation at a time
+        if self.generator_thread is not None and self.generator_thread.isRunning():
+            return
+
+        # Disable generate buttons during generation
         self.generate_btn.setEnabled(False)
+        self.regenerate_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         self.progress_label.setVisible(True)
@@ -769,32 +983,71 @@ class WorkflowGeneratorDialog(QDialog):
         # Check if we're customizing a loaded template
         if self.loaded_template and self.loaded_template_code:
             # Template customization mode
-            self.generator_thread = TemplateCustomizerThread(
-                self.loaded_template_code,
-                description,
-                self.generated_metadata
+            self.generator_thread = AIWorkerThread(
+                'customize_template',
+                template_code=self.loaded_template_code,
+                customization_request=description,
+                template_metadata=self.generated_metadata,
+                use_cache=use_cache
             )
             self.generator_thread.progress.connect(self.on_generation_progress)
+            self.generator_thread.code_chunk.connect(self.on_generation_code_chunk)
             self.generator_thread.finished.connect(self.on_generation_finished)
             self.generator_thread.start()
         else:
             # Normal workflow generation mode
             category = self.category_combo.currentText()
-            use_templates = [] if not self.use_templates_check.isChecked() else ['all']
-
-            self.generator_thread = WorkflowGeneratorThread(
-                description, category, use_templates
+            use_templates = _USE_TEMPLATES_ALL if self.use_templates_check.isChecked() else ()
+
+            self.generator_thread = AIWorkerThread(
+                'generate_workflow',
+                description=description,
+                category=category,
+                use_templates=use_templates,
+                use_cache=use_cache
             )
             self.generator_thread.progress.connect(self.on_generation_progress)
+            self.generator_thread.code_chunk.connect(self.on_generation_code_chunk)
             self.generator_thread.finished.connect(self.on_generation_finished)
             self.generator_thread.start()
 
+    def regenerate_workflow(self):
+        """Generate again with a fresh AI response instead of the cached one"""
+        self.generate_workflow(use_cache=False)
+
     def on_generation_progress(self, message: str):
         """Update progress message"""
         self.progress_label.setText(message)
 
+    def on_generation_code_chunk(self, chunk: str):
+        """Append a chunk of the streamed AI response to the preview"""
+        if not self._streaming_preview:
+            # Highlighting is reattached once the final code is installed
+            self._streaming_preview = True
+            self.highlighter.setDocument(None)
+            self.code_preview.clear()
+
+        cursor = self.code_preview.textCursor()
+        cursor.movePosition(cursor.End)
+        cursor.insertText(chunk)
+        self.code_preview.setTextCursor(cursor)
+
     def on_generation_finished(self, result: dict):
         """Handle generation completion"""
+        # Release the finished worker now rather than when the next generation replaces it
+        if self.generator_thread is not None:
+            self.generator_thread.quit()
+            self.generator_thread.wait()
+            self.generator_thread.deleteLater()
+            self.generator_thread = None
+
+        # Replace a streamed response: with the parsed code below, or on
+        # failure with whatever the preview showed before
+        if self._streaming_preview:
+            self._streaming_preview = False
+            if not result['success']:
+                self._set_preview_code(self.generated_code)
+
         self.generate_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.progress_label.setVisible(False)
@@ -808,13 +1061,14 @@ class WorkflowGeneratorDialog(QDialog):
             }
 
             # Update preview
-            self.code_preview.setPlainText(self.generated_code)
+            self._set_preview_code(self.generated_code)
             self.name_display.setText(f"Name: {self.generated_metadata['name']}")
             self.category_display.setText(f"Category: {self.category_combo.currentText()}")
 
             # Enable save buttons
             self.save_btn.setEnabled(True)
             self.save_and_run_btn.setEnabled(True)
+            self.regenerate_btn.setEnabled(True)
 
             QMessageBox.information(
                 self,
@@ -838,7 +1092,6 @@ class WorkflowGeneratorDialog(QDialog):
 
                 if reply == QMessageBox.Yes:
                     # Open settings dialog
-                    from .settings_dialog import SettingsDialog
                     settings = SettingsDialog(self)
                     settings.tabs.setCurrentIndex(0)  # Go to API Keys tab
                     if settings.exec_():
@@ -861,21 +1114,27 @@ class WorkflowGeneratorDialog(QDialog):
 
         try:
             # Generate filename from name
-            safe_name = "".join(c if c.isalnum() or c in (' ', '_') else '_'
-                              for c in self.generated_metadata['name'])
+            safe_name = self.generated_metadata['name'].translate(_SAFE_FILENAME_TABLE)
+            if not safe_name.isascii():
+                safe_name = _UNSAFE_FILENAME_RE.sub('_', safe_name)
             safe_name = safe_name.replace(' ', '_').lower()
             filename = f"{safe_name}.py"
 
-            # Get user_scripts/custom directory
-            project_root = Path(__file__).parent.parent.parent
-            custom_dir = project_root / "user_scripts" / "custom"
-            custom_dir.mkdir(parents=True, exist_ok=True)
+            # Create user_scripts/custom on the first save
+            global _custom_dir_ready
+            if not _custom_dir_ready:
+                _CUSTOM_SCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
+                _custom_dir_ready = True
 
             # Save file
-            file_path = custom_dir / filename
-
-            # Check if file exists
-            if file_path.exists():
+            file_path = _CUSTOM_SCRIPTS_DIR / filename
+            file_path_str = os.fspath(file_path)  # Converted once for open, log, label and signal
+
+            # Create the file only if it doesn't exist; an existing file is
+            # reported by the open itself instead of a separate exists() check
+            try:
+                fd = os.open(file_path_str, _WRITE_FLAGS | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
                 reply = QMessageBox.question(
                     self,
                     "File Exists",
@@ -884,20 +1143,19 @@ class WorkflowGeneratorDialog(QDialog):
                 )
                 if reply == QMessageBox.No:
                     return
+                fd = os.open(file_path_str, _WRITE_FLAGS | os.O_CREAT | os.O_TRUNC, 0o644)
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(self.generated_code)
+            # Encode once and write straight to the descriptor
+            _write_fd(fd, self.generated_code.encode('utf-8'))
 
-            self.logger.info(f"Workflow saved to: {file_path}")
+            self.logger.info(f"Workflow saved to: {file_path_str}")
 
-            QMessageBox.information(
-                self,
-                "Saved",
-                f"Workflow saved successfully!\n\nLocation: {file_path}\n\n"
-                "The workflow will appear in your script library after refreshing."
-            )
+            # Confirm inline rather than with a modal box; the main window
+            # refreshes the library and shows the name in its status bar
+            self.progress_label.setText(f"Workflow saved to: {file_path_str}")
+            self.progress_label.setVisible(True)
 
-            self.workflow_created.emit(str(file_path))
+            self.workflow_created.emit(file_path_str)
 
             return file_path
 
@@ -10,8 +10,8 @@ from pathlib import Path
 # Ensure the src directory is in the path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QMessageBox
+from PyQt5.QtCore import Qt, QTimer
 
 from core.config import get_config_manager
 from core.logging_config import get_logging_manager
@@ -39,6 +39,13 @@ def setup_application():
     return config_manager, logging_manager, error_handler
 
 
+def prewarm_message_box():
+    """Build and polish a throwaway QMessageBox so the first real one opens without style setup."""
+    box = QMessageBox(QMessageBox.NoIcon, "", "")
+    box.ensurePolished()
+    box.deleteLater()
+
+
 def main():
     """Main application entry point."""
     try:
@@ -58,6 +65,9 @@ def main():
         main_window = MainWindow()
         main_window.show()
 
+        # Once the window has painted, resolve the message box style ahead of the first popup
+        QTimer.singleShot(0, prewarm_message_box)
+
         # Start event loop
         sys.exit(app.exec_())
 
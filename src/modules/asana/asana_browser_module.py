@@ -17,24 +17,46 @@ Requirements:
 - pyautogui for input control
 """
 
+import functools
+import io
 import logging
+import os
+import re
 import time
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-import sys
+import webbrowser
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from modules.base_module import BaseModule, ModuleStatus
-from modules.desktop_rpa import InputController, WindowManager
+from ..base_module import BaseModule, ModuleStatus
+from ..desktop_rpa import InputController, WindowManager
 
 try:
     import pyautogui
+    from PIL import Image  # Installed with pyautogui
     PYAUTOGUI_AVAILABLE = True
+    # Newer pyautogui raises instead of returning None when an image isn't on screen
+    _IMAGE_NOT_FOUND = getattr(pyautogui, 'ImageNotFoundException', ())
 except ImportError:
     PYAUTOGUI_AVAILABLE = False
+    _IMAGE_NOT_FOUND = ()
+
+try:
+    import pyperclip  # Installed with pyautogui
+    PYPERCLIP_AVAILABLE = True
+except ImportError:
+    PYPERCLIP_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=32)
+def _decode_reference_image(image_path: str, mtime_ns: int):
+    """Decode a reference image; mtime_ns is only part of the cache key."""
+    with Image.open(image_path) as image:
+        return image.convert('RGB')
+
+
+def _load_reference_image(image_path: str):
+    """Get a reference image, decoded again only if the file has changed."""
+    return _decode_reference_image(image_path, os.stat(image_path).st_mtime_ns)
 
 
 class AsanaBrowserModule(BaseModule):
@@ -47,8 +69,19 @@ class AsanaBrowserModule(BaseModule):
         - tasks: Task data (for create/update operations)
         - wait_time: Time to wait for page loads (default 3 seconds)
         - auto_login: Whether to handle login automatically (default False)
+        - typing_interval: Pause between keystrokes when the clipboard is
+          unavailable and text is typed (default 0, paced by the OS)
+        - ready_image: Reference image shown once the project page has loaded
+          (e.g. the "Add task" button); page-load waits end as soon as it appears
+        - logged_in_image: Reference image shown once logged in (e.g. your avatar);
+          the manual-login wait ends as soon as it appears
     """
 
+    VALID_OPERATIONS = ('read_tasks', 'create_task', 'create_tasks', 'update_task')
+    _VALID_OPERATION_SET = frozenset(VALID_OPERATIONS)
+    _TASK_OPERATIONS = frozenset({'create_task', 'create_tasks', 'update_task'})
+    _ASANA_URL_RE = re.compile(r'^https?://[^/]*asana\.com', re.IGNORECASE)
+
     def __init__(self):
         super().__init__(
             name="AsanaBrowserModule",
@@ -64,6 +97,18 @@ class AsanaBrowserModule(BaseModule):
         self.tasks = []
         self.wait_time = 3
         self.auto_login = False
+        self.ready_image = None
+        self.logged_in_image = None
+
+        # image_path -> (left, top, width, height) where it was last found;
+        # cleared when the page changes
+        self._click_cache: Dict[str, Tuple[int, int, int, int]] = {}
+
+        # Resolved once in configure() instead of on every screenshot
+        self._screenshot_dir: Optional[Path] = None
+
+        # Result of the last validate(); reset whenever the module is reconfigured
+        self._validated: Optional[bool] = None
 
     def configure(self, **kwargs) -> bool:
         """
@@ -75,7 +120,11 @@ class AsanaBrowserModule(BaseModule):
             tasks: Task data (for create/update operations)
             wait_time: Page load wait time in seconds
             auto_login: Handle login automatically
+            ready_image: Reference image that appears once the page has loaded
+            logged_in_image: Reference image that appears once logged in
         """
+        self._validated = None
+
         try:
             # Validate pyautogui availability
             if not PYAUTOGUI_AVAILABLE:
@@ -85,7 +134,7 @@ class AsanaBrowserModule(BaseModule):
             # Initialize controllers
             self.input_controller = InputController(
                 default_delay=kwargs.get('default_delay', 0.5),
-                typing_interval=kwargs.get('typing_interval', 0.05)
+                typing_interval=kwargs.get('typing_interval', 0)
             )
             self.window_manager = WindowManager()
 
@@ -99,11 +148,18 @@ class AsanaBrowserModule(BaseModule):
             self.tasks = kwargs.get('tasks', [])
             self.wait_time = kwargs.get('wait_time', 3)
             self.auto_login = kwargs.get('auto_login', False)
+            self.ready_image = kwargs.get('ready_image')
+            self.logged_in_image = kwargs.get('logged_in_image')
 
             # Store config
-            self.set_config('asana_url', self.asana_url)
-            self.set_config('operation', self.operation)
-            self.set_config('wait_time', self.wait_time)
+            self.set_configs(
+                asana_url=self.asana_url,
+                operation=self.operation,
+                wait_time=self.wait_time
+            )
+
+            self._screenshot_dir = self.get_output_path('')
+            self._screenshot_dir.mkdir(parents=True, exist_ok=True)
 
             self.log_info(f"Configured for operation: {self.operation}")
             return True
@@ -113,20 +169,24 @@ class AsanaBrowserModule(BaseModule):
             return False
 
     def validate(self) -> bool:
-        """Validate configuration."""
+        """Validate configuration (the result is reused until the next configure)."""
+        if self._validated is None:
+            self._validated = self._validate()
+        return self._validated
+
+    def _validate(self) -> bool:
         try:
             # Validate URL
-            if 'asana.com' not in self.asana_url.lower():
+            if not self._ASANA_URL_RE.match(self.asana_url):
                 self.log_warning(f"URL doesn't look like an Asana URL: {self.asana_url}")
 
             # Validate operation
-            valid_operations = ['read_tasks', 'create_task', 'create_tasks', 'update_task']
-            if self.operation not in valid_operations:
-                self.log_error(f"Invalid operation: {self.operation}. Must be one of {valid_operations}")
+            if self.operation not in self._VALID_OPERATION_SET:
+                self.log_error(f"Invalid operation: {self.operation}. Must be one of {list(self.VALID_OPERATIONS)}")
                 return False
 
             # Validate tasks for create/update operations
-            if self.operation in ['create_task', 'create_tasks', 'update_task']:
+            if self.operation in self._TASK_OPERATIONS:
                 if not self.tasks:
                     self.log_error(f"Operation '{self.operation}' requires 'tasks' parameter")
                     return False
@@ -173,14 +233,13 @@ class AsanaBrowserModule(BaseModule):
         try:
             self.log_info(f"Opening Asana: {self.asana_url}")
 
-            # Open default browser (you can also use webbrowser module)
-            # For now, using keyboard shortcut approach
-            import webbrowser
+            # Open default browser
             webbrowser.open(self.asana_url)
+            self._click_cache.clear()
 
             # Wait for page to load
-            self.log_info(f"Waiting {self.wait_time} seconds for page to load...")
-            time.sleep(self.wait_time)
+            self.log_info(f"Waiting up to {self.wait_time} seconds for page to load...")
+            self._wait_for(self.ready_image, self.wait_time)
 
         except Exception as e:
             self.log_error(f"Failed to open Asana: {e}")
@@ -197,8 +256,42 @@ class AsanaBrowserModule(BaseModule):
         - 2FA handling if enabled
         """
         self.log_warning("Auto-login is not fully implemented. Please log in manually.")
-        self.log_info("Waiting 10 seconds for manual login...")
-        time.sleep(10)
+        self.log_info("Waiting up to 10 seconds for manual login...")
+        self._wait_for(self.logged_in_image, 10)
+        self._click_cache.clear()
+
+    def _wait_for(self, image_path: Optional[str], timeout: float) -> bool:
+        """
+        Wait until a reference image appears on screen.
+
+        Polls every 100 ms and returns as soon as the image is found. Without
+        an image there is nothing to poll for, so the full timeout is slept.
+
+        Args:
+            image_path: Reference image to wait for (or None)
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the image appeared within the timeout
+        """
+        if not image_path:
+            time.sleep(timeout)
+            return False
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if self._locate(image_path, 0.8):
+                    return True
+            except Exception as e:
+                self.log_warning(f"Could not search screen for {image_path}: {e}")
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                return False
+
+            if time.monotonic() >= deadline:
+                self.log_warning(f"{image_path} did not appear within {timeout} seconds")
+                return False
+            time.sleep(0.1)
 
     def _read_tasks(self) -> Dict[str, Any]:
         """
@@ -217,7 +310,7 @@ class AsanaBrowserModule(BaseModule):
             self.log_info("Reading tasks from Asana...")
 
             # Wait for page to stabilize
-            time.sleep(self.wait_time)
+            self._wait_for(self.ready_image, self.wait_time)
 
             # Placeholder: In real implementation, would use:
             # - pyautogui.locateOnScreen() to find task list
@@ -238,7 +331,7 @@ class AsanaBrowserModule(BaseModule):
             self.log_error(f"Failed to read tasks: {e}")
             raise
 
-    def _create_single_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_single_task(self, task: Dict[str, Any], bulk: bool = False) -> Dict[str, Any]:
         """
         Create a single task in Asana via UI automation.
 
@@ -250,13 +343,16 @@ class AsanaBrowserModule(BaseModule):
 
         Args:
             task: Task dictionary with name, description, assignee, due_date
+            bulk: Part of a bulk run; per-task progress is logged at DEBUG
+                  and failures are reported by the caller
 
         Returns:
             Result dictionary
         """
+        log = self.log_debug if bulk else self.log_info
         try:
             task_name = task.get('name', 'Untitled Task')
-            self.log_info(f"Creating task: {task_name}")
+            log(f"Creating task: {task_name}")
 
             # Method 1: Use keyboard shortcut (usually Tab or Quick Add)
             # Tab key opens quick add in most Asana layouts
@@ -265,17 +361,17 @@ class AsanaBrowserModule(BaseModule):
             # Wait for input field to appear
             time.sleep(0.5)
 
-            # Type task name
-            self.input_controller.type_text(task_name, interval=0.05)
+            # Enter task name
+            self._paste_text(task_name)
 
             # Press Enter to create
             self.input_controller.press_key('enter', delay=0.5)
 
-            self.log_info(f"✓ Created task: {task_name}")
+            log(f"✓ Created task: {task_name}")
 
             # Optionally set additional fields
             if task.get('description') or task.get('assignee') or task.get('due_date'):
-                self.log_info("Setting additional task fields...")
+                log("Setting additional task fields...")
                 # Click on task to open details (would need position)
                 # Set assignee, due date, description
                 # This requires more specific implementation based on Asana layout
@@ -286,7 +382,8 @@ class AsanaBrowserModule(BaseModule):
             )
 
         except Exception as e:
-            self.log_error(f"Failed to create task: {e}")
+            if not bulk:
+                self.log_error(f"Failed to create task: {e}")
             raise
 
     def _create_multiple_tasks(self, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -304,24 +401,30 @@ class AsanaBrowserModule(BaseModule):
 
             created_tasks = []
             failed_tasks = []
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            total = len(tasks)
 
+            # Per-task progress is DEBUG only; one summary line is logged at the end
             for i, task in enumerate(tasks, 1):
-                self.log_info(f"Creating task {i}/{len(tasks)}: {task.get('name')}")
+                if debug:
+                    self.log_debug(f"Creating task {i}/{total}: {task.get('name')}")
 
                 try:
-                    result = self._create_single_task(task)
+                    self._create_single_task(task, bulk=True)
                     created_tasks.append(task.get('name'))
 
                     # Small delay between tasks
                     time.sleep(1)
 
                 except Exception as e:
-                    self.log_error(f"Failed to create task: {e}")
+                    self.log_error(f"Failed to create task {task.get('name')}: {e}")
                     failed_tasks.append({
                         'name': task.get('name'),
                         'error': str(e)
                     })
 
+            self.log_info(f"Batch complete: {len(created_tasks)}/{total} tasks created")
+
             return self.success_result(
                 {
                     'created_count': len(created_tasks),
@@ -336,6 +439,33 @@ class AsanaBrowserModule(BaseModule):
             self.log_error(f"Bulk task creation failed: {e}")
             raise
 
+    def _paste_text(self, text: str):
+        """
+        Enter text into the focused field with a single clipboard paste.
+
+        Much faster than typing character by character. The previous clipboard
+        contents are restored afterwards. Falls back to typing if the clipboard
+        is unavailable or the paste keystroke fails.
+
+        Args:
+            text: Text to enter
+        """
+        if PYPERCLIP_AVAILABLE:
+            try:
+                previous = pyperclip.paste()
+                pyperclip.copy(text)
+                try:
+                    pasted = self.input_controller.hotkey('ctrl', 'v')
+                finally:
+                    pyperclip.copy(previous)
+                if pasted:
+                    return
+                self.log_debug("Paste failed, typing instead")
+            except pyperclip.PyperclipException as e:
+                self.log_debug(f"Clipboard unavailable, typing instead: {e}")
+
+        self.input_controller.type_text(text)
+
     def _update_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update an existing task.
@@ -384,16 +514,24 @@ class AsanaBrowserModule(BaseModule):
         """
         try:
             if filename is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"asana_screenshot_{timestamp}.png"
+                filename = f"asana_screenshot_{time.strftime('%Y%m%d_%H%M%S')}.png"
+
+            if self._screenshot_dir is None:
+                self._screenshot_dir = self.get_output_path('')
+                self._screenshot_dir.mkdir(parents=True, exist_ok=True)
 
-            filepath = self.get_output_path(filename)
+            filepath = os.fspath(self._screenshot_dir / filename)
 
+            # Encode in memory with light compression (these are throwaway
+            # debug shots), then write the file in one go
+            buffer = io.BytesIO()
             screenshot = pyautogui.screenshot()
-            screenshot.save(str(filepath))
+            screenshot.save(buffer, format='PNG', compress_level=1)
+            with open(filepath, 'wb') as f:
+                f.write(buffer.getbuffer())
 
             self.log_info(f"Screenshot saved: {filepath}")
-            return str(filepath)
+            return filepath
 
         except Exception as e:
             self.log_error(f"Failed to take screenshot: {e}")
@@ -415,14 +553,27 @@ class AsanaBrowserModule(BaseModule):
             True if found and clicked
         """
         try:
-            location = pyautogui.locateOnScreen(image_path, confidence=confidence)
+            location = None
+
+            # Look where the element was last found first: matching a small
+            # region is far cheaper than searching the whole screen
+            cached = self._click_cache.get(image_path)
+            if cached:
+                left, top, width, height = cached
+                region = (max(0, left - 10), max(0, top - 10), width + 20, height + 20)
+                location = self._locate(image_path, confidence, region)
+
+            if not location:
+                location = self._locate(image_path, confidence)
 
             if location:
+                self._click_cache[image_path] = tuple(location)
                 center = pyautogui.center(location)
                 self.input_controller.click(center.x, center.y)
                 self.log_info(f"Found and clicked element at {center}")
                 return True
             else:
+                self._click_cache.pop(image_path, None)
                 self.log_warning(f"Element not found on screen: {image_path}")
                 return False
 
@@ -430,6 +581,17 @@ class AsanaBrowserModule(BaseModule):
             self.log_error(f"Find and click failed: {e}")
             return False
 
+    @staticmethod
+    def _locate(image_path: str, confidence: float,
+                region: Optional[Tuple[int, int, int, int]] = None):
+        """Locate an image on screen (or in a region of it); None if not found."""
+        try:
+            return pyautogui.locateOnScreen(
+                _load_reference_image(image_path), confidence=confidence, region=region
+            )
+        except _IMAGE_NOT_FOUND:
+            return None
+
 
 # Example usage
 if __name__ == '__main__':
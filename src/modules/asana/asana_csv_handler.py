@@ -17,15 +17,72 @@ Use cases:
 
 import csv
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from operator import itemgetter
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
-import sys
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from modules.base_module import BaseModule
+from ..base_module import BaseModule
+
+try:
+    from python_calamine import CalamineWorkbook  # Optional native .xlsx reader
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+try:
+    import orjson  # Optional faster JSON encoder/decoder
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Task keys and the Asana export columns they are read from
+_TASK_COLUMNS = (
+    ('name', 'Task Name'),
+    ('assignee', 'Assignee'),
+    ('due_date', 'Due Date'),
+    ('notes', 'Notes'),
+    ('priority', 'Priority'),
+    ('section', 'Section'),
+    ('tags', 'Tags'),
+    ('projects', 'Projects'),
+    ('created_at', 'Created At'),
+    ('completed_at', 'Completed At'),
+)
+_TASK_KEYS = tuple(key for key, _ in _TASK_COLUMNS)
+
+# Splits a comma-separated tag list, trimming the tags in the same pass
+_TAG_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# Buffer size for CSV and JSON files; large files are read and written in few, big chunks
+_FILE_BUFFER_SIZE = 1 << 20
+
+# Output directories already created by this process
+_ensured_dirs = set()
+
+
+def _ensure_parent_dir(filepath: str) -> None:
+    """Create the directory filepath goes in, once per directory."""
+    parent = Path(filepath).parent
+    if parent not in _ensured_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
+
+
+# Asana import columns and the task keys they are filled from (first key
+# present wins); other columns are left blank
+_CSV_COLUMN_SOURCES = {
+    'Task Name': ('name', 'task_name'),
+    'Assignee': ('assignee', 'assigned_to'),
+    'Due Date': ('due_date', 'deadline'),
+    'Notes': ('notes', 'description'),
+    'Priority': ('priority',),
+    'Section': ('section', 'category'),
+    'Tags': ('tags',),
+    'Projects': ('projects',),
+}
 
 
 class AsanaCSVHandler(BaseModule):
@@ -157,21 +214,19 @@ class AsanaCSVHandler(BaseModule):
 
             self.log_info(f"Generating Asana CSV with {len(self.tasks)} tasks...")
 
-            # Prepare CSV data
-            csv_data = []
-            for task in self.tasks:
-                csv_row = self._task_to_csv_row(task)
-                csv_data.append(csv_row)
-
-            # Write CSV file
-            self._write_csv(self.output_file, csv_data)
+            # Write CSV file, rows zipped from the column lists
+            if self.tasks:
+                rows = zip(*self._task_columns(self.tasks))
+                self._write_csv_rows(self.output_file, self.asana_columns, rows)
+            else:
+                self.log_warning("No data to write to CSV")
 
             return self.success_result(
                 {
                     'output_file': self.output_file,
-                    'task_count': len(csv_data)
+                    'task_count': len(self.tasks)
                 },
-                f"Generated CSV with {len(csv_data)} tasks"
+                f"Generated CSV with {len(self.tasks)} tasks"
             )
 
         except Exception as e:
@@ -188,20 +243,18 @@ class AsanaCSVHandler(BaseModule):
         try:
             self.log_info(f"Parsing Asana CSV: {self.input_file}")
 
-            tasks = []
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with self._open_csv(self.input_file) as f:
+                reader = csv.reader(f)
+                tasks = self._iter_csv_tasks(next(reader, []), reader)
 
-                for row in reader:
-                    task = self._csv_row_to_task(row)
-                    tasks.append(task)
+                # Save to output file if specified, writing tasks as they are parsed
+                if self.output_file:
+                    tasks = self._save_tasks_to_file(tasks, self.output_file)
+                else:
+                    tasks = list(tasks)
 
             self.log_info(f"Parsed {len(tasks)} tasks from CSV")
 
-            # Save to output file if specified
-            if self.output_file:
-                self._save_tasks_to_file(tasks, self.output_file)
-
             return self.success_result(
                 {
                     'tasks': tasks,
@@ -234,38 +287,21 @@ class AsanaCSVHandler(BaseModule):
 
             # Read input CSV
             tasks = []
-            with open(self.input_file, 'r', encoding='utf-8') as f:
+            with self._open_csv(self.input_file) as f:
                 reader = csv.DictReader(f)
 
+                # Work out the column mapping once from the header
+                plan = self._convert_plan(reader.fieldnames or [])
+
                 for row in reader:
-                    # Map columns to Asana format
-                    task = {}
-                    for asana_col, source_col in self.mapping.items():
-                        if source_col in row:
-                            task[asana_col] = row[source_col]
-
-                    # Add any unmapped columns
-                    for key, value in row.items():
-                        if key not in self.mapping.values() and key not in task:
-                            # Try to intelligently map
-                            if 'name' in key.lower() or 'title' in key.lower():
-                                task['Task Name'] = value
-                            elif 'assign' in key.lower():
-                                task['Assignee'] = value
-                            elif 'date' in key.lower() or 'due' in key.lower():
-                                task['Due Date'] = value
-                            elif 'note' in key.lower() or 'desc' in key.lower():
-                                task['Notes'] = value
-
-                    tasks.append(task)
+                    tasks.append({asana_col: row[source_col] for asana_col, source_col in plan})
 
             # Write Asana-format CSV
             if not self.output_file:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 self.output_file = str(self.get_output_path(f"asana_import_{timestamp}.csv"))
 
-            csv_data = [task for task in tasks]
-            self._write_csv(self.output_file, csv_data)
+            self._write_csv(self.output_file, tasks)
 
             self.log_info(f"Converted {len(tasks)} tasks to Asana format")
 
@@ -281,62 +317,118 @@ class AsanaCSVHandler(BaseModule):
             self.log_error(f"Failed to convert CSV: {e}")
             raise
 
-    def _task_to_csv_row(self, task: Dict[str, Any]) -> Dict[str, str]:
+    def _convert_plan(self, fieldnames: List[str]) -> List[Tuple[str, str]]:
         """
-        Convert task dictionary to Asana CSV row.
+        Decide which source column fills which Asana column.
+
+        Explicitly mapped columns come first; the remaining source columns
+        are matched on their names.
 
         Args:
-            task: Task dictionary
+            fieldnames: Source CSV header
 
         Returns:
-            CSV row dictionary with Asana column names
+            (Asana column, source column) pairs in assignment order
         """
-        row = {}
+        plan = []
+        targets = set()
+        for asana_col, source_col in self.mapping.items():
+            if source_col in fieldnames:
+                plan.append((asana_col, source_col))
+                targets.add(asana_col)
+
+        # Add any unmapped columns
+        mapped_sources = set(self.mapping.values())
+        for key in fieldnames:
+            if key in mapped_sources or key in targets:
+                continue
+
+            # Try to intelligently map
+            lowered = key.lower()
+            if 'name' in lowered or 'title' in lowered:
+                asana_col = 'Task Name'
+            elif 'assign' in lowered:
+                asana_col = 'Assignee'
+            elif 'date' in lowered or 'due' in lowered:
+                asana_col = 'Due Date'
+            elif 'note' in lowered or 'desc' in lowered:
+                asana_col = 'Notes'
+            else:
+                continue
+            plan.append((asana_col, key))
+            targets.add(asana_col)
 
-        # Map common fields
-        row['Task Name'] = task.get('name', task.get('task_name', ''))
-        row['Assignee'] = task.get('assignee', task.get('assigned_to', ''))
-        row['Due Date'] = task.get('due_date', task.get('deadline', ''))
-        row['Notes'] = task.get('notes', task.get('description', ''))
-        row['Priority'] = task.get('priority', '')
-        row['Section'] = task.get('section', task.get('category', ''))
-        row['Tags'] = task.get('tags', '')
-        row['Projects'] = task.get('projects', '')
+        return plan
 
-        # Handle tags if list
-        if isinstance(row['Tags'], list):
-            row['Tags'] = ', '.join(row['Tags'])
+    def _task_columns(self, tasks: List[Dict[str, Any]]) -> List[List[Any]]:
+        """
+        Read task dictionaries into one list of values per Asana column.
+
+        Each column is filled by a single comprehension over all tasks, so
+        no per-task row dict is built.
 
-        return row
+        Args:
+            tasks: Task dictionaries
 
-    def _csv_row_to_task(self, row: Dict[str, str]) -> Dict[str, Any]:
+        Returns:
+            Column value lists, in the order of asana_columns
+        """
+        columns = []
+        for column in self.asana_columns:
+            keys = _CSV_COLUMN_SOURCES.get(column)
+            if keys is None:
+                values = [''] * len(tasks)
+            elif len(keys) == 1:
+                key, = keys
+                values = [task.get(key, '') for task in tasks]
+            else:
+                key, fallback = keys
+                values = [task.get(key, task.get(fallback, '')) for task in tasks]
+
+            # Handle tags if list
+            if column == 'Tags':
+                values = [', '.join(v) if isinstance(v, list) else v for v in values]
+
+            columns.append(values)
+
+        return columns
+
+    def _iter_csv_tasks(self, header: List[str], rows: Iterable[List[str]]) -> Iterator[Dict[str, Any]]:
         """
-        Convert Asana CSV row to task dictionary.
+        Convert Asana CSV rows to task dictionaries, one row at a time.
+
+        Column positions are looked up once from the header, so rows are read
+        by index instead of each being turned into a dict first.
 
         Args:
-            row: CSV row dictionary
+            header: CSV header row
+            rows: Remaining CSV rows
 
-        Returns:
-            Task dictionary
+        Yields:
+            Task dictionaries
         """
-        task = {
-            'name': row.get('Task Name', row.get('Name', '')),
-            'assignee': row.get('Assignee', ''),
-            'due_date': row.get('Due Date', ''),
-            'notes': row.get('Notes', ''),
-            'priority': row.get('Priority', ''),
-            'section': row.get('Section', ''),
-            'tags': row.get('Tags', ''),
-            'projects': row.get('Projects', ''),
-            'created_at': row.get('Created At', ''),
-            'completed_at': row.get('Completed At', '')
-        }
+        # Missing columns point one past the last column, where each row
+        # is padded with ''
+        width = len(header)
+        positions = {column: i for i, column in enumerate(header)}
+        positions.setdefault('Task Name', positions.get('Name', width))
+        get_fields = itemgetter(*(positions.get(column, width) for _, column in _TASK_COLUMNS))
+        padding = [''] * (width + 1)
+
+        for row in rows:
+            if not row:
+                continue  # Blank line
+            if len(row) == width:
+                row.append('')
+            else:
+                row = row[:width] + padding[min(len(row), width):]
+            task = dict(zip(_TASK_KEYS, get_fields(row)))
 
-        # Convert tags to list if present
-        if task['tags']:
-            task['tags'] = [tag.strip() for tag in task['tags'].split(',')]
+            # Convert tags to list if present
+            if task['tags']:
+                task['tags'] = _TAG_SPLIT_RE.split(task['tags'].strip())
 
-        return task
+            yield task
 
     def _write_csv(self, filepath: str, data: List[Dict[str, Any]]) -> None:
         """
@@ -351,23 +443,44 @@ class AsanaCSVHandler(BaseModule):
             return
 
         # Ensure directory exists
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent_dir(filepath)
 
-        # Determine columns from first row + standard columns
+        # Determine columns: standard columns, then any other keys in first-seen order
         columns = list(self.asana_columns)
+        seen = set(columns)
         for row in data:
-            for key in row.keys():
-                if key not in columns:
+            for key in row:
+                if key not in seen:
+                    seen.add(key)
                     columns.append(key)
 
         # Write CSV
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=_FILE_BUFFER_SIZE) as f:
             writer = csv.DictWriter(f, fieldnames=columns)
             writer.writeheader()
             writer.writerows(data)
 
         self.log_info(f"CSV file written: {filepath}")
 
+    def _write_csv_rows(self, filepath: str, columns: List[str], rows: Iterable[tuple]) -> None:
+        """
+        Write CSV file from rows already in column order.
+
+        Args:
+            filepath: Output file path
+            columns: Header row
+            rows: Row tuples matching columns
+        """
+        # Ensure directory exists
+        _ensure_parent_dir(filepath)
+
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=_FILE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(rows)
+
+        self.log_info(f"CSV file written: {filepath}")
+
     def _load_tasks_from_file(self, filepath: str) -> List[Dict[str, Any]]:
         """
         Load tasks from Excel or JSON file.
@@ -390,18 +503,31 @@ class AsanaCSVHandler(BaseModule):
             raise ValueError(f"Unsupported file format: {ext}")
 
     def _load_from_excel(self, filepath: str) -> List[Dict[str, Any]]:
-        """Load tasks from Excel file."""
+        """Load tasks from Excel file (python-calamine if installed, else openpyxl)."""
+        if CALAMINE_AVAILABLE:
+            # calamine cannot tell which sheet is active, so only use it when
+            # there is a single sheet and leave openpyxl to pick otherwise
+            calamine_workbook = CalamineWorkbook.from_path(filepath)
+            if len(calamine_workbook.sheet_names) == 1:
+                sheet = calamine_workbook.get_sheet_by_index(0)
+                return self._rows_to_tasks(iter(sheet.to_python()))
+
         from openpyxl import load_workbook
 
-        workbook = load_workbook(filepath)
-        sheet = workbook.active
+        workbook = load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            return self._rows_to_tasks(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
 
+    def _rows_to_tasks(self, rows: Iterator[tuple]) -> List[Dict[str, Any]]:
+        """Build task dicts from sheet rows, the first row being the header."""
         # Read header
-        headers = [cell.value for cell in sheet[1]]
+        headers = next(rows, ())
 
         # Read tasks
         tasks = []
-        for row in sheet.iter_rows(min_row=2, values_only=True):
+        for row in rows:
             task = {}
             for i, value in enumerate(row):
                 if i < len(headers) and headers[i]:
@@ -412,11 +538,15 @@ class AsanaCSVHandler(BaseModule):
         return tasks
 
     def _load_from_json(self, filepath: str) -> List[Dict[str, Any]]:
-        """Load tasks from JSON file."""
-        import json
+        """Load tasks from JSON file (parsed with orjson if installed)."""
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            import json
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
 
         if isinstance(data, list):
             return data
@@ -427,23 +557,52 @@ class AsanaCSVHandler(BaseModule):
 
     def _load_from_csv(self, filepath: str) -> List[Dict[str, Any]]:
         """Load tasks from CSV file."""
-        tasks = []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                tasks.append(dict(row))
-        return tasks
+        with self._open_csv(filepath) as f:
+            return list(csv.DictReader(f))
+
+    @staticmethod
+    def _open_csv(filepath: str):
+        """
+        Open a CSV file for reading.
+
+        Uses a large read buffer, and newline='' so the csv module sees line
+        endings untranslated (as it expects).
+        """
+        return open(filepath, 'r', newline='', encoding='utf-8', buffering=_FILE_BUFFER_SIZE)
+
+    def _save_tasks_to_file(self, tasks: Iterable[Dict[str, Any]], filepath: str) -> List[Dict[str, Any]]:
+        """
+        Save tasks to a JSON file, writing each one as it arrives.
+
+        Each task is encoded on its own (with orjson if installed), one per
+        line of the JSON array, instead of indenting the whole list in one
+        pure-Python pass.
+
+        Returns:
+            The saved tasks as a list
+        """
+        if ORJSON_AVAILABLE:
+            encode = orjson.dumps
+        else:
+            import json
 
-    def _save_tasks_to_file(self, tasks: List[Dict[str, Any]], filepath: str) -> None:
-        """Save tasks to JSON file."""
-        import json
+            def encode(task):
+                return json.dumps(task).encode('utf-8')
 
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent_dir(filepath)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(tasks, f, indent=2)
+        saved = []
+        with open(filepath, 'wb', buffering=_FILE_BUFFER_SIZE) as f:
+            separator = b'[\n  '
+            for task in tasks:
+                f.write(separator)
+                f.write(encode(task))
+                separator = b',\n  '
+                saved.append(task)
+            f.write(b'\n]\n' if saved else b'[]\n')
 
         self.log_info(f"Tasks saved to: {filepath}")
+        return saved
 
 
 # Example usage
@@ -11,16 +11,12 @@ How it works:
 - Special syntax for assignee (@username) and due dates
 """
 
+import functools
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from modules.base_module import BaseModule, ModuleStatus
+from ..base_module import BaseModule, ModuleStatus
 
 try:
     import win32com.client
@@ -29,6 +25,26 @@ except ImportError:
     WIN32COM_AVAILABLE = False
 
 
+# Email body lines for each optional task field, in body order
+_BODY_FIELD_LINES = (
+    ('description', ('{description}', '')),
+    ('assignee', ('Assignee: {assignee}',)),
+    ('due_date', ('Due: {due_date}',)),
+    ('tags', ('Tags: {tags}',)),
+    ('notes', ('', 'Notes:', '{notes}')),
+)
+
+
+@functools.lru_cache(maxsize=1 << len(_BODY_FIELD_LINES))
+def _body_template(mask: int) -> str:
+    """Format string for an email body; bit i of mask set if field i is present."""
+    lines = []
+    for i, (_, field_lines) in enumerate(_BODY_FIELD_LINES):
+        if mask >> i & 1:
+            lines.extend(field_lines)
+    return '\n'.join(lines)
+
+
 class AsanaEmailModule(BaseModule):
     """
     Create Asana tasks via email-to-task integration.
@@ -57,6 +73,7 @@ class AsanaEmailModule(BaseModule):
         )
 
         self.outlook = None
+        self._create_mail = None  # Bound Outlook CreateItem, resolved once per connection
         self.project_email = None
         self.tasks = []
 
@@ -113,15 +130,15 @@ class AsanaEmailModule(BaseModule):
                 self.log_error("No tasks to create")
                 return False
 
-            # Validate each task
-            for i, task in enumerate(self.tasks):
-                if not isinstance(task, dict):
-                    self.log_error(f"Task {i} is not a dictionary")
-                    return False
-
-                if 'name' not in task:
-                    self.log_error(f"Task {i} missing required 'name' field")
-                    return False
+            # Validate each task, stopping at the first bad one
+            bad = next((i for i, task in enumerate(self.tasks)
+                        if not isinstance(task, dict) or 'name' not in task), -1)
+            if bad >= 0:
+                if not isinstance(self.tasks[bad], dict):
+                    self.log_error(f"Task {bad} is not a dictionary")
+                else:
+                    self.log_error(f"Task {bad} missing required 'name' field")
+                return False
 
             self.log_info("Validation passed")
             return True
@@ -139,7 +156,9 @@ class AsanaEmailModule(BaseModule):
             created_tasks = []
             failed_tasks = []
 
-            # Create each task
+            # Create each task. Sends stay sequential: Outlook runs its object
+            # model on its own UI thread, so calls from worker threads (each
+            # with its own Dispatch) would only queue up behind one another
             for i, task in enumerate(self.tasks, 1):
                 self.log_info(f"Creating task {i}/{len(self.tasks)}: {task['name']}")
 
@@ -183,6 +202,7 @@ class AsanaEmailModule(BaseModule):
         """Connect to Outlook."""
         try:
             self.outlook = win32com.client.Dispatch("Outlook.Application")
+            self._create_mail = self.outlook.CreateItem
             self.log_info("Connected to Outlook")
         except Exception as e:
             self.log_error(f"Failed to connect to Outlook: {e}")
@@ -205,45 +225,30 @@ class AsanaEmailModule(BaseModule):
         elif priority == 'medium':
             subject = '! ' + subject
 
-        # Build email body (task description)
-        body_parts = []
-
-        # Add description if provided
-        if task.get('description'):
-            body_parts.append(task['description'])
-            body_parts.append('')  # Blank line
-
-        # Add assignee if provided
-        if task.get('assignee'):
-            assignee = task['assignee']
-            # Add @ if not already present
-            if not assignee.startswith('@'):
-                assignee = '@' + assignee
-            body_parts.append(f"Assignee: {assignee}")
-
-        # Add due date if provided
-        if task.get('due_date'):
-            due_date = task['due_date']
-            # Format: "Due: YYYY-MM-DD" or "Due: next Friday"
-            body_parts.append(f"Due: {due_date}")
-
-        # Add tags if provided
-        if task.get('tags'):
-            tags = task['tags']
-            if isinstance(tags, list):
-                tags = ', '.join(tags)
-            body_parts.append(f"Tags: {tags}")
-
-        # Add notes if provided
-        if task.get('notes'):
-            body_parts.append('')
-            body_parts.append('Notes:')
-            body_parts.append(task['notes'])
-
-        body = '\n'.join(body_parts)
+        # Build email body (task description) from the template for the
+        # fields this task has
+        fields = {}
+        mask = 0
+        for i, (key, _) in enumerate(_BODY_FIELD_LINES):
+            value = task.get(key)
+            if value:
+                fields[key] = value
+                mask |= 1 << i
+
+        # Add @ to the assignee if not already present
+        assignee = fields.get('assignee')
+        if assignee and not assignee.startswith('@'):
+            fields['assignee'] = '@' + assignee
+
+        # Tags may be a list
+        tags = fields.get('tags')
+        if isinstance(tags, list):
+            fields['tags'] = ', '.join(tags)
+
+        body = _body_template(mask).format_map(fields)
 
         # Create and send email
-        mail = self.outlook.CreateItem(0)  # 0 = MailItem
+        mail = self._create_mail(0)  # 0 = MailItem
         mail.To = self.project_email
         mail.Subject = subject
         mail.Body = body
@@ -282,33 +287,25 @@ class AsanaEmailModule(BaseModule):
 
             self.log_info(f"Loading tasks from Excel: {excel_path}")
 
-            workbook = load_workbook(excel_path)
-            sheet = workbook.active
-
-            # Read header row
-            headers = []
-            for cell in sheet[1]:
-                headers.append(cell.value.lower() if cell.value else '')
-
-            # Validate required columns
-            if 'name' not in headers:
-                raise ValueError("Excel must have 'name' column")
-
-            # Read tasks
-            tasks = []
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                # Skip empty rows
-                if not any(row):
-                    continue
-
-                # Build task dictionary
-                task = {}
-                for i, value in enumerate(row):
-                    if i < len(headers) and headers[i] and value:
-                        task[headers[i]] = str(value)
-
-                if task.get('name'):
-                    tasks.append(task)
+            workbook = load_workbook(excel_path, read_only=True)
+            try:
+                rows = workbook.active.iter_rows(values_only=True)
+
+                # Read header row as plain values, no Cell objects
+                headers = [value.lower() if value else '' for value in next(rows, ())]
+
+                # Validate required columns
+                if 'name' not in headers:
+                    raise ValueError("Excel must have 'name' column")
+
+                # Read tasks, skipping empty rows and cells
+                tasks = []
+                for row in rows:
+                    task = {header: str(value) for header, value in zip(headers, row) if header and value}
+                    if task.get('name'):
+                        tasks.append(task)
+            finally:
+                workbook.close()
 
             self.log_info(f"Loaded {len(tasks)} tasks from Excel")
             return tasks
@@ -4,6 +4,7 @@ Provides common functionality, logging, configuration, and error handling.
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -68,6 +69,7 @@ class BaseModule(ABC):
         self.status = ModuleStatus.NOT_CONFIGURED
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
+        self._duration: Optional[float] = None  # Seconds, from the monotonic clock
         self.error: Optional[Exception] = None
         self.result: Optional[Dict[str, Any]] = None
 
@@ -128,6 +130,8 @@ class BaseModule(ABC):
         Returns:
             dict: Execution result
         """
+        started = None
+        self._duration = None  # Don't report the previous run's duration
         try:
             # Configure
             self.log_info("Configuring module...")
@@ -146,21 +150,24 @@ class BaseModule(ABC):
             # Execute
             self.status = ModuleStatus.RUNNING
             self.start_time = datetime.now()
+            started = time.perf_counter()
 
             result = self.execute()
 
+            self._duration = time.perf_counter() - started
             self.end_time = datetime.now()
             self.status = ModuleStatus.COMPLETED
             self.result = result
 
-            duration = (self.end_time - self.start_time).total_seconds()
-            self.log_info(f"Execution completed in {duration:.2f} seconds")
+            self.log_info(f"Execution completed in {self._duration:.2f} seconds")
 
             return result
 
         except Exception as e:
             self.status = ModuleStatus.FAILED
             self.error = e
+            if started is not None:
+                self._duration = time.perf_counter() - started
             self.end_time = datetime.now()
 
             error_info = self.handle_error(
@@ -171,22 +178,22 @@ class BaseModule(ABC):
 
             return self.error_result(error_info['message'])
 
-    # Logging methods
+    # Logging methods (the prefix is only formatted if the record is emitted)
     def log_info(self, message: str):
         """Log an info message."""
-        self.logger.info(f"[{self.name}] {message}")
+        self.logger.info("[%s] %s", self.name, message)
 
     def log_warning(self, message: str):
         """Log a warning message."""
-        self.logger.warning(f"[{self.name}] {message}")
+        self.logger.warning("[%s] %s", self.name, message)
 
     def log_error(self, message: str):
         """Log an error message."""
-        self.logger.error(f"[{self.name}] {message}")
+        self.logger.error("[%s] %s", self.name, message)
 
     def log_debug(self, message: str):
         """Log a debug message."""
-        self.logger.debug(f"[{self.name}] {message}")
+        self.logger.debug("[%s] %s", self.name, message)
 
     # Configuration methods
     def get_config(self, key: str, default: Any = None) -> Any:
@@ -212,6 +219,15 @@ class BaseModule(ABC):
         """
         self._config[key] = value
 
+    def set_configs(self, **values: Any):
+        """
+        Set several module configuration values in one update.
+
+        Args:
+            **values: Configuration keys and values
+        """
+        self._config.update(values)
+
     def get_app_config(self, key: str, default: Any = None) -> Any:
         """
         Get an application configuration value.
@@ -337,9 +353,7 @@ class BaseModule(ABC):
         Returns:
             float: Duration in seconds or None if not completed
         """
-        if self.start_time and self.end_time:
-            return (self.end_time - self.start_time).total_seconds()
-        return None
+        return self._duration
 
     def get_status_info(self) -> Dict[str, Any]:
         """
@@ -365,6 +379,7 @@ class BaseModule(ABC):
         self.status = ModuleStatus.NOT_CONFIGURED
         self.start_time = None
         self.end_time = None
+        self._duration = None
         self.error = None
         self.result = None
         self.log_info("Module reset")
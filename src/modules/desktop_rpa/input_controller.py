@@ -259,7 +259,7 @@ class InputController:
 
         Args:
             text: Text to type
-            interval: Interval between keystrokes
+            interval: Interval between keystrokes (0 types without pausing)
             delay: Delay after typing
 
         Returns:
@@ -267,7 +267,9 @@ class InputController:
         """
         try:
             self.logger.debug(f"Typing text: {text[:50]}...")
-            pyautogui.typewrite(text, interval=interval or self.typing_interval)
+            if interval is None:
+                interval = self.typing_interval
+            pyautogui.typewrite(text, interval=interval)
             time.sleep(delay or self.default_delay)
             return True
 
@@ -3,16 +3,11 @@ OneNote Manager Module.
 High-level API for OneNote automation using COM interface.
 """
 
-import sys
-from pathlib import Path
 from typing import Dict, List, Optional, Any
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from base_module import BaseModule
-from onenote.com_client import OneNoteCOMClient
-from onenote.content_formatter import OneNoteContentBuilder, TemplateBuilder
+from ..base_module import BaseModule
+from .com_client import OneNoteCOMClient
+from .content_formatter import OneNoteContentBuilder, TemplateBuilder
 
 
 class OneNoteManager(BaseModule):
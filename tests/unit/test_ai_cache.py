@@ -0,0 +1,61 @@
+"""
+Unit tests for AIResponseCache.
+"""
+
+import os
+import time
+from pathlib import Path
+
+from core.ai_cache import AIResponseCache
+
+
+class TestAIResponseCache:
+    """Tests for AIResponseCache class."""
+
+    def test_set_and_get(self, temp_dir: Path):
+        """Test that a cached response is returned for the same key."""
+        cache = AIResponseCache(cache_dir=str(temp_dir / "ai"))
+        key = cache.make_key('model', 4000, 'prompt')
+
+        assert cache.get(key) is None
+
+        cache.set(key, 'response text')
+
+        assert cache.get(key) == 'response text'
+
+    def test_key_depends_on_request(self):
+        """Test that different model settings or prompts get different keys."""
+        key = AIResponseCache.make_key('model', 4000, 'prompt')
+
+        assert key == AIResponseCache.make_key('model', 4000, 'prompt')
+        assert key != AIResponseCache.make_key('other-model', 4000, 'prompt')
+        assert key != AIResponseCache.make_key('model', 2000, 'prompt')
+        assert key != AIResponseCache.make_key('model', 4000, 'other prompt')
+
+    def test_expired_entry_discarded(self, temp_dir: Path):
+        """Test that entries older than max_age_days are not returned."""
+        cache = AIResponseCache(cache_dir=str(temp_dir / "ai"), max_age_days=1)
+        key = cache.make_key('model', 4000, 'prompt')
+        cache.set(key, 'response text')
+
+        old = time.time() - 2 * 86400
+        os.utime(cache.cache_dir / f"{key}.json", (old, old))
+
+        assert cache.get(key) is None
+        assert not (cache.cache_dir / f"{key}.json").exists()
+
+    def test_prune_keeps_max_entries(self, temp_dir: Path):
+        """Test that the least recently used entries are discarded."""
+        cache = AIResponseCache(cache_dir=str(temp_dir / "ai"), max_entries=2)
+        keys = [cache.make_key('model', 4000, f'prompt {i}') for i in range(3)]
+
+        for i, key in enumerate(keys):
+            cache.set(key, f'response {i}')
+            path = cache.cache_dir / f"{key}.json"
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+        cache._prune()
+
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[1]) == 'response 1'
+        assert cache.get(keys[2]) == 'response 2'
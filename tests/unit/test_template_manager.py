@@ -227,6 +227,29 @@ def run():
         assert result is not None
         assert Path(result).exists()
 
+    def test_import_template_reuses_code_and_validation(
+        self,
+        template_manager: TemplateManager,
+        temp_dir: Path,
+        sample_template_code: str
+    ):
+        """Test importing with pre-read code skips reading and re-validating."""
+        validation = template_manager.validate_template(sample_template_code)
+        missing_file = temp_dir / "already_read.py"
+
+        with patch.object(template_manager, 'validate_template') as mock_validate:
+            result = template_manager.import_template(
+                source_path=str(missing_file),
+                category="custom",
+                source_code=sample_template_code,
+                validation=validation
+            )
+
+        mock_validate.assert_not_called()
+        assert result is not None
+        assert Path(result).name == "already_read.py"
+        assert Path(result).read_text() == sample_template_code
+
     def test_import_template_invalid(
         self,
         template_manager: TemplateManager,